@@ -0,0 +1,140 @@
+# benchmarks/bench_transport.py
+# Per-command latency of the WebDriver operations the page objects use, over Selenium's
+# default connection and over utils.transport's pooled keep-alive connection.
+# Run from swag-tests/:  python -m benchmarks.bench_transport [--iterations 200] [--remote-url URL]
+import argparse
+import threading
+import time
+from urllib.parse import urljoin
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.common.by import By
+from local_app.server import LocalSwagServer
+from pages.base_page import FILL_JS, RESOLVE_JS
+from utils.stats import percentile
+from utils.transport import pooled_connection
+from utils.waits import OBSERVE_JS, SCRIPT_TIMEOUT
+
+THREADS = 4
+
+
+def launch(remote_url=None):
+    options = ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--window-size=1400,900")
+    if remote_url:
+        drv = webdriver.Remote(command_executor=remote_url, options=options)
+        server_url = remote_url
+    else:
+        drv = webdriver.Chrome(service=ChromeService(), options=options)
+        server_url = drv.service.service_url
+    drv.implicitly_wait(0)
+    drv.set_script_timeout(SCRIPT_TIMEOUT)
+    return drv, server_url
+
+
+def operations(drv, base_url):
+    """name -> (setup, op); setup puts the page in the state the op needs"""
+    def on_login():
+        drv.get(base_url)
+
+    def on_inventory():
+        drv.get(base_url)
+        drv.add_cookie({"name": "session-username", "value": "standard_user", "path": "/"})
+        drv.get(urljoin(base_url, "inventory.html"))
+
+    locators = [[By.CLASS_NAME, "title"], [By.CLASS_NAME, "shopping_cart_link"], [By.CSS_SELECTOR, ".inventory_item button"]]
+    fields = [[By.ID, "user-name", "standard_user"], [By.ID, "password", "secret_sauce"]]
+    state = {}
+
+    def input_field():
+        state["input"] = state.get("input") or drv.find_element(By.ID, "user-name")
+        return state["input"]
+
+    def title():
+        state["title"] = state.get("title") or drv.find_element(By.CLASS_NAME, "title")
+        return state["title"]
+
+    def first_button():
+        state["button"] = state.get("button") or drv.find_element(By.CSS_SELECTOR, ".inventory_item button")
+        return state["button"]
+
+    def concurrent_find():
+        # Several threads on one session, as with browser contexts or the load runner
+        threads = [threading.Thread(target=drv.find_element, args=(By.CLASS_NAME, "title")) for _ in range(THREADS)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    return {
+        "get_timeouts (transport floor)": (None, lambda: drv.timeouts),
+        "current_url": (on_login, lambda: drv.current_url),
+        "find_element": (on_login, lambda: drv.find_element(By.ID, "user-name")),
+        "clear": (on_login, lambda: input_field().clear()),
+        "send_keys": (on_login, lambda: input_field().send_keys("x")),
+        "click": (on_login, lambda: input_field().click()),
+        "text": (on_inventory, lambda: title().text),
+        "is_displayed": (on_inventory, lambda: title().is_displayed()),
+        "click (add/remove toggle)": (on_inventory, lambda: first_button().click()),
+        "execute_script (batched resolve)": (on_inventory, lambda: drv.execute_script(RESOLVE_JS, locators)),
+        "execute_script (batched fill)": (on_login, lambda: drv.execute_script(FILL_JS, fields)),
+        "execute_async_script (observed wait)": (
+            on_inventory, lambda: drv.execute_async_script(OBSERVE_JS, "present", By.CLASS_NAME, "title", 1000)),
+        f"find_element x{THREADS} threads": (on_inventory, concurrent_find),
+    }, state
+
+
+def measure(op, iterations):
+    for _ in range(5):
+        op()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        op()
+        samples.append((time.perf_counter() - start) * 1000)
+    return sorted(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WebDriver command latency per transport")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--pool-size", type=int, default=THREADS)
+    parser.add_argument("--remote-url", default=None, help="Grid / remote WebDriver URL instead of a local chromedriver")
+    args = parser.parse_args()
+
+    server = LocalSwagServer().start()
+    drv, server_url = launch(args.remote_url)
+    transports = {
+        "selenium": ChromiumRemoteConnection(remote_server_addr=server_url, vendor_prefix="goog", browser_name="chrome"),
+        "pooled": pooled_connection(server_url, args.pool_size),
+    }
+    results = {}
+    try:
+        ops, state = operations(drv, server.url)
+        for name, (setup, op) in ops.items():
+            for transport, connection in transports.items():
+                # Same browser session for both transports, so only the HTTP layer differs
+                drv.command_executor = connection
+                state.clear()
+                if setup:
+                    setup()
+                results[(name, transport)] = measure(op, args.iterations)
+    finally:
+        drv.quit()
+        server.stop()
+
+    target = args.remote_url or "local chromedriver"
+    print(f"Per-command latency against {target}, {args.iterations} iterations (ms)")
+    print(f"{'operation':<40} {'transport':<9} {'p50':>7} {'p95':>7} {'mean':>7}")
+    for name in ops:
+        for transport in transports:
+            values = results[(name, transport)]
+            print(f"{name:<40} {transport:<9} {percentile(values, 50):7.2f} {percentile(values, 95):7.2f} "
+                  f"{sum(values) / len(values):7.2f}")
+
+
+if __name__ == "__main__":
+    main()
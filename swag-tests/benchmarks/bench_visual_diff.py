@@ -0,0 +1,60 @@
+# benchmarks/bench_visual_diff.py
+# Times the legacy ImageChops helper against utils.visual_diff on the stored screenshots.
+# Run from swag-tests/:  python -m benchmarks.bench_visual_diff [baseline.png current.png]
+import os
+import sys
+import tempfile
+import timeit
+from PIL import Image, ImageChops
+from utils.visual_diff import VisualDiff
+
+SCREENSHOT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "screenshots")
+DEFAULT_PAIR = ("visual_user_baseline.png", "visual_user_current.png")
+
+
+def legacy_compare(baseline_path, current_path, diff_path):
+    im1 = Image.open(baseline_path).convert("RGBA")
+    im2 = Image.open(current_path).convert("RGBA")
+    if im1.size != im2.size:
+        im2 = im2.resize(im1.size)
+    diff = ImageChops.difference(im1, im2)
+    if diff.getbbox() is None:
+        return True
+    diff.save(diff_path)
+    return False
+
+
+def bench(label, fn, number=5):
+    best = min(timeit.repeat(fn, number=1, repeat=number))
+    print(f"{label:<40} {best * 1000:8.1f} ms")
+
+
+def main(argv):
+    baseline, current = argv[:2] if len(argv) >= 2 else [os.path.join(SCREENSHOT_DIR, p) for p in DEFAULT_PAIR]
+    size = Image.open(baseline).size
+    print(f"Comparing {os.path.basename(baseline)} vs {os.path.basename(current)} ({size[0]}x{size[1]})")
+
+    # Identical images: the common case on every passing visual check
+    diff_path = os.path.join(tempfile.gettempdir(), "bench_diff.png")
+    bench("legacy, identical", lambda: legacy_compare(baseline, baseline, diff_path))
+    bench("numpy, identical", lambda: VisualDiff().compare(baseline, baseline))
+    current_png = open(current, "rb").read()
+    bench("numpy, cached baseline vs PNG bytes", lambda: VisualDiff().compare(baseline, current_png))
+
+    bench("legacy, given pair", lambda: legacy_compare(baseline, current, diff_path))
+    bench("numpy, given pair (full score)", lambda: VisualDiff(early_exit=False).compare(baseline, current))
+    bench("numpy, given pair (early exit)", lambda: VisualDiff().compare(baseline, current))
+
+    # A small localized change, e.g. one moved button
+    changed = Image.open(baseline).convert("RGB")
+    changed.paste((255, 0, 0), (600, 400, 700, 440))
+    changed_path = os.path.join(tempfile.gettempdir(), "bench_changed.png")
+    changed.save(changed_path)
+    bench("legacy, 100x40 change", lambda: legacy_compare(baseline, changed_path, diff_path))
+    bench("numpy, 100x40 change (early exit)", lambda: VisualDiff().compare(baseline, changed_path))
+    bench("numpy, 100x40 change (full + heatmap)",
+          lambda: VisualDiff(early_exit=False).compare(baseline, changed_path, diff_path))
+    print(VisualDiff(early_exit=False).compare(baseline, changed_path))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,5 +1,7 @@
 # conftest.py
 import os
+import json
+import shutil
 import datetime
 import pytest
 from selenium import webdriver
@@ -7,34 +9,149 @@ from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from webdriver_manager.chrome import ChromeDriverManager
 from pages.login_page import LoginPage
-from pytest_html import extras
+from data.users import USERS, LOCKED_USERS
+from local_app.server import PROFILES, LocalSwagServer, parse_user_profiles
+from utils.auth_state import AuthStateCache, origin_dir
+from utils.browser_contexts import BrowserContexts
+from utils.browser_pool import BrowserPool
+from utils.browser_startup import DriverCache, STARTUP_STATS, apply_fast_profile, timed
+from utils.flight_recorder import FLIGHT, enable_console_log
+from utils.incremental import OutcomeCache, app_fingerprint, combine, files_fingerprint
+from utils.instrumentation import COMMAND_LOG, LatencyHistogram, instrument
+from utils.journeys import JourneyRunner, JourneyTree, validate
+from utils.layout_fingerprint import LayoutBaselines, capture, diff
+from utils.network import (
+    HAR_MODES, POLICIES, AssetCacheDirs, apply_policy, drain_events, enable_har_logging, har_path,
+    network_events, write_har,
+)
+from utils.perf import PERF, PerfStore
+from utils.reporting import ResultStream, artifact_path, render_html
+from utils.screenshot_store import ScreenshotStore
+from utils.timings import TimingStore
+from utils.transport import TRANSPORTS, pooled_connection, use_pooled_transport
+from utils.visual_diff import VisualDiff
+from utils.waits import SCRIPT_TIMEOUT, WAIT_STATS
 
 # --- Directories for screenshots and reports ---
 BASE_DIR = os.path.dirname(__file__)
 SCREENSHOT_DIR = os.path.join(BASE_DIR, "screenshots")
 REPORTS_DIR = os.path.join(BASE_DIR, "reports")
+AUTH_STATE_DIR = os.path.join(BASE_DIR, ".auth_state")
+PERF_DIR = os.path.join(REPORTS_DIR, "perf")
+HAR_DIR = os.path.join(REPORTS_DIR, "har")
+FLIGHT_DIR = os.path.join(REPORTS_DIR, "flight")
+LAYOUT_DIR = os.path.join(SCREENSHOT_DIR, "layouts")
+DRIVER_CACHE = DriverCache(os.path.join(BASE_DIR, ".driver_cache"))
+LOCAL_APP_DIR = os.path.join(BASE_DIR, "local_app")
+# Sources every test depends on besides its own module
+SHARED_SOURCES = [os.path.join(BASE_DIR, p) for p in ("conftest.py", "pages", "data", "utils")]
+# Stored expectations and the options that change what a test checks or how the app behaves
+BASELINES = [LAYOUT_DIR, os.path.join(PERF_DIR, "baseline.json")]
+BEHAVIOUR_OPTIONS = ["--perf", "--latency", "--user-profile", "--network-policy", "--fast"]
 os.makedirs(SCREENSHOT_DIR, exist_ok=True)
 os.makedirs(REPORTS_DIR, exist_ok=True)
 
 # --- Generate timestamped report filename ---
 timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 REPORT_FILE = os.path.join(REPORTS_DIR, f"report_{timestamp}.html")
+RESULTS_FILE = os.path.join(REPORTS_DIR, "results", f"results_{timestamp}.jsonl")
+COMMANDS_FILE = os.path.join(REPORTS_DIR, "results", f"commands_{timestamp}.json")
+STARTUP_DIR = os.path.join(REPORTS_DIR, "results", "startup")
+
+# Shared by the main process and its xdist workers; set in pytest_configure
+RUN_ID = timestamp
+
+# Created in pytest_configure on the main process only
+RESULT_STREAM = None
+TIMING_STORE = None
+
+# nodeid -> seconds across setup/call/teardown in this run, recorded on the main process
+MEASURED_DURATIONS = {}
+# Tests that were skipped (including CACHED ones); their near-zero durations are not recorded
+UNMEASURED = set()
+
+# Per-method WebDriver latencies, merged from every test's command log on the main process
+COMMAND_HISTOGRAM = LatencyHistogram()
+
+# Failure screenshots, stored by content hash under screenshots/store/
+SCREENSHOT_STORE = ScreenshotStore(os.path.join(SCREENSHOT_DIR, "store"), run_id=timestamp)
+
+# nodeid -> (seconds waited, number of waits, slowest wait)
+WAIT_TIMES = {}
+
+# Start states declared with @pytest.mark.journey, built from the collected tests
+JOURNEY_TREE = JourneyTree()
+
+# Journey steps replayed through the UI vs restored from snapshots, summed on the main process
+JOURNEY_TOTALS = {"replayed": 0, "restored": 0}
+
+# --incremental: per-test outcomes across runs, and the app build they ran against; set in pytest_configure
+OUTCOME_CACHE = None
+APP_FINGERPRINT = None
+
+# Persistent HTTP cache dirs for launched browsers; set in pytest_configure unless --no-asset-cache
+ASSET_CACHE = None
 
 # --- Pytest CLI options ---
 def pytest_addoption(parser):
     parser.addoption("--headless", action="store_true", default=False, help="Run browser in headless mode")
     parser.addoption("--browser", action="store", default="chrome", help="Browser to run tests (chrome, firefox, edge)")
     parser.addoption("--base-url", action="store", default="https://www.saucedemo.com/", help="Base URL for the application under test")
+    parser.addoption("--local-app", action="store_true", default=False, help="Run against the bundled local Swag Labs stand-in instead of --base-url")
+    parser.addoption("--latency", action="store", default="none", choices=sorted(PROFILES), help="Default latency profile for --local-app")
+    parser.addoption("--user-profile", action="append", default=[], metavar="USER=PROFILE", help="Per-user latency profile for --local-app")
+    parser.addoption("--fast", action="store_true", default=False, help="Lean browser profile (no images/GPU/background services) for non-visual tests")
+    parser.addoption("--profile-template", action="store", default=None, help="User-data dir copied for each --fast browser instead of creating a fresh profile")
+    parser.addoption("--perf", action="store_true", default=False, help="Collect Navigation/Paint timings after page transitions")
+    parser.addoption("--perf-history", action="store", type=int, default=20, help="Runs of stored timings used for p95 budgets")
+    parser.addoption("--perf-update-baseline", action="store_true", default=False, help="Save this run's p95 timings as the new baseline")
+    parser.addoption("--schedule-by-duration", action="store_true", default=False, help="With -n: group tests by user and send the longest work to workers first, using recorded timings")
+    parser.addoption("--incremental", action="store_true", default=False, help="Skip tests that passed last time against the same app build and test sources; run earlier failures first")
+    parser.addoption("--full-run", action="store_true", default=False, help="With --incremental, run every test and refresh the cache")
+    parser.addoption("--incremental-cache", action="store", default=os.path.join(BASE_DIR, ".test_cache.json"), help="Where --incremental keeps per-test outcomes")
+    parser.addoption("--timings-file", action="store", default=os.path.join(BASE_DIR, ".test_timings.json"), help="Where per-test durations are recorded across runs")
+    parser.addoption("--network-policy", action="store", default="full", choices=sorted(POLICIES), help="Requests blocked for tests without a network marker ('lean' blocks images, fonts and analytics); visual tests always get 'full'")
+    parser.addoption("--har", action="store", default="off", choices=HAR_MODES, help="Record a HAR per test under reports/har/ (for failed tests only, or all)")
+    parser.addoption("--asset-cache-dir", action="store", default=os.path.join(BASE_DIR, ".asset_cache"), help="Persistent HTTP cache shared by the browsers of each worker")
+    parser.addoption("--no-asset-cache", action="store_true", default=False, help="Start every browser with an empty HTTP cache")
+    parser.addoption("--flight-actions", action="store", type=int, default=50, help="Page-object actions kept by the flight recorder and written on failure (0 disables)")
+    parser.addoption("--remote-url", action="store", default=None, help="Selenium Grid / remote WebDriver URL; browsers are launched locally when omitted")
+    parser.addoption("--transport", action="store", default="pooled", choices=TRANSPORTS, help="WebDriver HTTP transport: tuned keep-alive pool, or Selenium's default connection")
+    parser.addoption("--transport-pool-size", action="store", type=int, default=4, help="Keep-alive connections per WebDriver server in each worker")
+    parser.addoption("--pool-size", action="store", type=int, default=2, help="Warm browsers kept per worker")
+    parser.addoption("--recycle-commands", action="store", type=int, default=5000, help="Relaunch a browser after this many WebDriver commands")
+    parser.addoption("--wait-budget", action="store", type=float, default=15.0, help="Seconds a single test may spend in explicit waits before it is reported")
+    parser.addoption("--recycle-memory-mb", action="store", type=int, default=512, help="Relaunch a browser once its JS heap exceeds this size")
 
 # --- Fixtures ---
 @pytest.fixture(scope="session")
 def base_url(request):
-    return request.config.getoption("--base-url")
+    config = request.config
+    if not config.getoption("--local-app"):
+        yield config.getoption("--base-url")
+        return
+    # One stand-in server per worker process, on a free port
+    server = LocalSwagServer(
+        latency=config.getoption("--latency"),
+        user_profiles=parse_user_profiles(config.getoption("--user-profile")),
+    ).start()
+    yield server.url
+    server.stop()
 
-@pytest.fixture(scope="session")
-def driver(request):
-    browser = request.config.getoption("--browser").lower()
-    headless = request.config.getoption("--headless")
+def _install_chromedriver():
+    try:
+        return ChromeDriverManager().install()
+    except Exception:
+        # Offline and not cached yet: use a chromedriver on PATH, or let Selenium Manager decide
+        return shutil.which("chromedriver")
+
+def make_driver(config, fast=False):
+    """Launch a new browser configured from the command line options"""
+    browser = config.getoption("--browser").lower()
+    headless = config.getoption("--headless")
+    remote_url = config.getoption("--remote-url")
+    pooled = config.getoption("--transport") == "pooled"
+    pool_size = config.getoption("--transport-pool-size")
 
     if browser == "chrome":
         options = ChromeOptions()
@@ -43,19 +160,246 @@ def driver(request):
         options.add_argument("--window-size=1400,900")
         prefs = {"credentials_enable_service": False, "profile.password_manager_enabled": False}
         options.add_experimental_option("prefs", prefs)
-        service = ChromeService(ChromeDriverManager().install())
-        drv = webdriver.Chrome(service=service, options=options)
+        # Profile template and cache dirs are local paths, so only for local browsers
+        template = None if remote_url else config.getoption("--profile-template")
+        profile_dir = apply_fast_profile(options, template) if fast else None
+        cache_dir = ASSET_CACHE.acquire() if ASSET_CACHE and not remote_url else None
+        if cache_dir:
+            options.add_argument(f"--disk-cache-dir={cache_dir}")
+        if FLIGHT.enabled:
+            enable_console_log(options)
+        if config.getoption("--har") != "off":
+            enable_har_logging(options)
+        if remote_url:
+            executor = pooled_connection(remote_url, pool_size) if pooled else remote_url
+            resolve_s = 0.0
+            drv, launch_s = timed(lambda: webdriver.Remote(command_executor=executor, options=options))
+        else:
+            driver_path, resolve_s = timed(lambda: DRIVER_CACHE.resolve(install=_install_chromedriver))
+            service = ChromeService(driver_path) if driver_path else ChromeService()
+            drv, launch_s = timed(lambda: webdriver.Chrome(service=service, options=options))
+            if pooled:
+                use_pooled_transport(drv, pool_size)
+        STARTUP_STATS.record(resolve_s, launch_s, fast)
     else:
         raise ValueError(f"Unsupported browser: {browser}")
 
-    drv.implicitly_wait(5)
-    yield drv
-    drv.quit()
+    if profile_dir or cache_dir:
+        quit_browser = drv.quit
+        def quit_and_clean():
+            quit_browser()
+            if profile_dir:
+                shutil.rmtree(profile_dir, ignore_errors=True)
+            if cache_dir:
+                ASSET_CACHE.release(cache_dir)
+        drv.quit = quit_and_clean
+
+    # No implicit wait: page objects wait explicitly through utils.waits,
+    # whose observed waits block inside execute_async_script
+    drv.implicitly_wait(0)
+    drv.set_script_timeout(SCRIPT_TIMEOUT)
+    return drv
+
+def _make_pool(config, base_url, fast, size):
+    return BrowserPool(
+        lambda: FLIGHT.install(instrument(make_driver(config, fast=fast))),
+        size=size,
+        origins=[base_url],
+        max_commands=config.getoption("--recycle-commands"),
+        max_memory_mb=config.getoption("--recycle-memory-mb"),
+    )
+
+@pytest.fixture(scope="session")
+def browser_pool(request, base_url):
+    config = request.config
+    pool = _make_pool(config, base_url, config.getoption("--fast"), config.getoption("--pool-size"))
+    yield pool
+    pool.close()
+
+@pytest.fixture(scope="session")
+def full_browser_pool(request, base_url):
+    """Full-fidelity browsers for @pytest.mark.visual tests when --fast is on; created on first use"""
+    pool = _make_pool(request.config, base_url, fast=False, size=1)
+    yield pool
+    pool.close()
+
+def network_policy(item, config):
+    """Policy from @pytest.mark.network("full"|"lean"), else full for visual tests, else --network-policy"""
+    marker = item.get_closest_marker("network")
+    if marker:
+        return marker.args[0]
+    if item.get_closest_marker("visual"):
+        return "full"
+    return config.getoption("--network-policy")
+
+@pytest.fixture
+def driver(request, browser_pool):
+    """A warm browser from the pool, reset to a clean state after the test"""
+    pool = browser_pool
+    if request.config.getoption("--fast") and request.node.get_closest_marker("visual"):
+        pool = request.getfixturevalue("full_browser_pool")
+    browser = pool.acquire()
+    apply_policy(browser.driver, network_policy(request.node, request.config))
+    if request.config.getoption("--har") != "off":
+        # Drop requests made by earlier tests and the pool reset
+        drain_events(browser.driver)
+    # Likewise console output from earlier tests, which would otherwise land in this test's flight record
+    FLIGHT.drain_console(browser.driver)
+    yield browser.driver
+    pool.release(browser)
 
 @pytest.fixture
 def login_page(driver, base_url):
     return LoginPage(driver, base_url=base_url)
 
+@pytest.fixture(scope="session")
+def auth_state(base_url):
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    return AuthStateCache(base_url, USERS, os.path.join(AUTH_STATE_DIR, worker))
+
+@pytest.fixture
+def logged_in_as(driver, login_page, auth_state):
+    """Open a page already authenticated as `username`, skipping the UI login.
+
+    Usage: logged_in_as("standard_user", cart=["Sauce Labs Backpack"])
+    """
+    def _logged_in_as(username, cart=None, path="inventory.html"):
+        if username in LOCKED_USERS:
+            pytest.skip(f"{username} cannot log in")
+        auth_state.apply(driver, username, cart=cart, path=path)
+        login_page.username = username
+        return login_page
+    return _logged_in_as
+
+@pytest.fixture(scope="session")
+def journey_runner(base_url, auth_state):
+    return JourneyRunner(base_url, auth_state, JOURNEY_TREE)
+
+@pytest.fixture
+def journey(request, driver, login_page, journey_runner):
+    """A UserSession already at the start state from @pytest.mark.journey(...), for the test's `username`.
+
+    Usage:
+        @pytest.mark.journey("inventory", "add:Sauce Labs Backpack", "cart")
+        @pytest.mark.parametrize("username", ["standard_user"])
+        def test_x(journey, username):
+            journey.checkout.start_checkout()
+    """
+    marker = request.node.get_closest_marker("journey")
+    if marker is None:
+        raise pytest.UsageError(f"{request.node.nodeid} uses the journey fixture without @pytest.mark.journey")
+    username = request.node.callspec.params["username"]
+    if username in LOCKED_USERS:
+        pytest.skip(f"{username} cannot log in")
+    session, replayed, restored = journey_runner.reach(driver, username, marker.args)
+    session.login = login_page
+    login_page.username = username
+    request.node.user_properties.append(("journey", {"replayed": replayed, "restored": restored}))
+    return session
+
+@pytest.fixture
+def user_sessions(request, driver, base_url, auth_state):
+    """Several users at once in one browser, each in its own isolated browser context.
+
+    Usage: session = user_sessions("standard_user", cart=["Sauce Labs Backpack"])
+    The returned UserSession has .login, .inventory and .checkout bound to that
+    user's context, and is safe to drive from its own thread.
+    """
+    contexts = BrowserContexts(driver)
+
+    def _open(username, cart=None, path="inventory.html"):
+        if username in LOCKED_USERS:
+            pytest.skip(f"{username} cannot log in")
+        session = contexts.session(username, base_url=base_url)
+        apply_policy(session.driver, network_policy(request.node, request.config))
+        FLIGHT.install(session.driver)
+        auth_state.apply(session.driver, username, cart=cart, path=path)
+        return session
+    yield _open
+    contexts.close_all()
+
+@pytest.fixture(autouse=True)
+def wait_budget(request):
+    """Track time spent in page-object waits for each test"""
+    WAIT_STATS.reset()
+    yield
+    request.node.user_properties.append(("wait_time_s", round(WAIT_STATS.total, 3)))
+    WAIT_TIMES[request.node.nodeid] = (WAIT_STATS.total, WAIT_STATS.count, WAIT_STATS.slowest)
+
+@pytest.fixture(autouse=True)
+def command_log(request):
+    """Record the WebDriver commands each test issues; shipped to the main process via the report"""
+    COMMAND_LOG.reset()
+    yield COMMAND_LOG
+    request.node.user_properties.append(("commands", COMMAND_LOG.entries))
+
+@pytest.fixture(autouse=True)
+def flight_recorder():
+    """Start each test with an empty action ring buffer"""
+    FLIGHT.reset()
+    yield FLIGHT
+
+@pytest.fixture(autouse=True)
+def perf_context(request):
+    """Tag timing samples with the test and the user it runs as"""
+    params = getattr(request.node, "callspec", None)
+    PERF.user = params.params.get("username", "unknown_user") if params else "unknown_user"
+    PERF.test = request.node.nodeid
+    PERF.reset()
+
+@pytest.fixture
+def perf_budget():
+    """Assert a p95 timing budget for a page across recent runs, e.g. perf_budget("inventory", p95_ms=2000).
+
+    Does nothing unless the run was started with --perf.
+    """
+    def _perf_budget(page, p95_ms, metric="transition", user=None):
+        if not PERF.enabled:
+            return None
+        result = PERF.evaluate(page, metric, p95_ms=p95_ms, user=user)
+        assert result is not None, f"No {metric} timings recorded for {page}"
+        assert result.passed, f"Performance budget exceeded: {result}"
+        return result
+    return _perf_budget
+
+@pytest.fixture
+def layout_check(request, base_url, screenshot_dir):
+    """Compare a page's layout fingerprint with its stored baseline, e.g. layout_check(driver, "visual_user").
+
+    Boxes, computed styles and image sources are read in one execute_script
+    and hashed; a screenshot is only taken and pixel-diffed when the hash
+    differs. A missing baseline is recorded together with its PNG and the
+    test xfails. Returns the element-level changes that were tolerated.
+    """
+    # Baselines belong to the app they were recorded against; the stand-in app's port changes every run
+    app = "local-app" if request.config.getoption("--local-app") else origin_dir(base_url)
+    baselines = LayoutBaselines(os.path.join(LAYOUT_DIR, app))
+
+    def _layout_check(driver, username, page="inventory"):
+        layout = capture(driver, page)
+        baseline = baselines.load(username, page)
+        name = f"{username}_{page}"
+        png_path = baselines.png_path(username, page)
+        if baseline is None:
+            baselines.save(username, page, layout, driver.get_screenshot_as_png())
+            pytest.xfail(f"Layout baseline created for {username} on {page}. Re-run to compare.")
+        if layout["digest"] == baseline["digest"]:
+            return []
+        changes = diff(baseline, layout)
+        if not changes:
+            return []
+        report = "\n  ".join(changes[:20]) + (f"\n  ... {len(changes) - 20} more" if len(changes) > 20 else "")
+        assert os.path.exists(png_path), f"Layout of {page} changed for {username}:\n  {report}"
+        current_png = driver.get_screenshot_as_png()
+        diff_path = os.path.join(screenshot_dir, f"{name}_diff.png")
+        result = VisualDiff().compare(png_path, current_png, diff_path)
+        if not result:
+            with open(os.path.join(screenshot_dir, f"{name}_current.png"), "wb") as f:
+                f.write(current_png)
+        assert result, f"Layout of {page} changed for {username} ({result}, see {diff_path}):\n  {report}"
+        return changes
+    return _layout_check
+
 @pytest.fixture
 def screenshot_dir():
     return SCREENSHOT_DIR
@@ -65,51 +409,259 @@ def screenshot_dir():
 def pytest_runtest_makereport(item, call):
     outcome = yield
     rep = outcome.get_result()
+    if rep.failed and rep.when in ("setup", "call") and FLIGHT.enabled:
+        # Before the screenshot, so the buffer ends with the test's own actions
+        try:
+            path = FLIGHT.dump(
+                item.funcargs.get("driver"), artifact_path(FLIGHT_DIR, RUN_ID, item.nodeid, ".json"),
+                item.nodeid, error=rep.longreprtext[-2000:],
+            )
+            rep.user_properties.append(("flight", os.path.relpath(path, REPORTS_DIR)))
+        except Exception as e:
+            print(f"\n[ERROR] Could not save flight recorder: {e}")
     if rep.when == "call" and rep.failed:
         driver = item.funcargs.get("driver")
         login_page_fixture = item.funcargs.get("login_page")
         username = getattr(login_page_fixture, "username", "unknown_user") if login_page_fixture else "unknown_user"
-        scenario = item.name.replace("/", "_").replace(" ", "_")
-        user_dir = os.path.join(SCREENSHOT_DIR, username)
-        os.makedirs(user_dir, exist_ok=True)
-        filename = os.path.join(user_dir, f"{scenario}.png")
         try:
             if driver:
-                driver.save_screenshot(filename)
-                print(f"\n[INFO] Screenshot saved to {filename}")
-                # Attach screenshot to pytest-html
-                if hasattr(rep, "extra"):
-                    rep.extra.append(extras.image(filename, mime_type='image/png'))
-                else:
-                    rep.extra = [extras.image(filename, mime_type='image/png')]
+                # Grab, decode and hash here; the file and index writes run on the store's writer thread
+                digest, filename = SCREENSHOT_STORE.capture(driver, item.nodeid, username)
+                print(f"\n[INFO] Screenshot {digest[:12]} queued for {filename}")
+                rep.user_properties.append(("screenshot", digest))
         except Exception as e:
             print(f"\n[ERROR] Could not save screenshot: {e}")
+    har = item.config.getoption("--har")
+    if rep.when == "call" and (har == "all" or (har == "failed" and rep.failed)):
+        driver = item.funcargs.get("driver")
+        try:
+            if driver:
+                path = write_har(har_path(HAR_DIR, RUN_ID, item.nodeid), network_events(driver), item.nodeid)
+                rep.user_properties.append(("har", os.path.relpath(path, REPORTS_DIR)))
+        except Exception as e:
+            print(f"\n[ERROR] Could not save HAR: {e}")
+
+# --- Streamed results ---
+def pytest_runtest_logreport(report):
+    if TIMING_STORE is not None:
+        if report.skipped or "cached" in report.keywords:
+            UNMEASURED.add(report.nodeid)
+            MEASURED_DURATIONS.pop(report.nodeid, None)
+        elif report.nodeid not in UNMEASURED:
+            MEASURED_DURATIONS[report.nodeid] = MEASURED_DURATIONS.get(report.nodeid, 0) + report.duration
+    if RESULT_STREAM and report.when == "teardown":
+        for name, value in report.user_properties:
+            if name == "commands":
+                COMMAND_HISTOGRAM.add_entries(value)
+            elif name == "journey":
+                JOURNEY_TOTALS["replayed"] += value["replayed"]
+                JOURNEY_TOTALS["restored"] += value["restored"]
+    if RESULT_STREAM:
+        outcome = RESULT_STREAM.record(report)
+        fingerprint = dict(report.user_properties).get("fingerprint")
+        if OUTCOME_CACHE is not None and fingerprint and outcome and outcome != "CACHED":
+            OUTCOME_CACHE.record(report.nodeid, fingerprint, outcome, RUN_ID)
 
 # --- Consolidated test summary ---
 @pytest.hookimpl(tryfirst=True)
 def pytest_sessionfinish(session, exitstatus):
-    passed = failed = xfailed = blocked = 0
-    for item in getattr(session, "items", []):
-        rep = getattr(item, "rep_call", None)
-        if rep:
-            if rep.skipped and getattr(rep, "wasxfail", False):
-                xfailed += 1
-            elif rep.failed:
-                failed += 1
-            elif rep.passed:
-                passed += 1
-        if "blocked" in getattr(item, "keywords", {}):
-            blocked += 1
+    SCREENSHOT_STORE.close()
+    if STARTUP_STATS.launches:
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+        STARTUP_STATS.write(os.path.join(STARTUP_DIR, f"startup_{RUN_ID}_{worker}.json"), worker)
+    if not RESULT_STREAM:
+        return
+    RESULT_STREAM.close()
+    TIMING_STORE.update(MEASURED_DURATIONS)
+    TIMING_STORE.save()
+    if OUTCOME_CACHE is not None:
+        OUTCOME_CACHE.save()
+    tally = RESULT_STREAM.tally
+    COMMAND_HISTOGRAM.write_json(COMMANDS_FILE)
+    render_html(
+        RESULT_STREAM.path, REPORT_FILE, tally,
+        screenshot_href=lambda digest: os.path.relpath(SCREENSHOT_STORE.path_for(digest), REPORTS_DIR),
+        sections=[("WebDriver commands by page-object method", COMMAND_HISTOGRAM.summary())],
+    )
 
     print("\n================ Test Summary ================")
-    print(f"PASSED : {passed}")
-    print(f"FAILED : {failed}")
-    print(f"XFAILED: {xfailed}")
-    print(f"BLOCKED: {blocked}")
+    print(f"PASSED : {tally['PASSED']}")
+    print(f"FAILED : {tally['FAILED']}")
+    print(f"XFAILED: {tally['XFAILED']}")
+    print(f"SKIPPED: {tally['SKIPPED']}")
+    print(f"BLOCKED: {tally['BLOCKED']}")
+    print(f"CACHED : {tally['CACHED']}")
     print("=============================================")
+    print(f"[INFO] HTML report saved to: {REPORT_FILE}")
+
+# --- Wait-time budget, startup and command latency report ---
+def _write_startup_summary(terminalreporter):
+    prefix = f"startup_{RUN_ID}_"
+    files = sorted(f for f in os.listdir(STARTUP_DIR) if f.startswith(prefix)) if os.path.isdir(STARTUP_DIR) else []
+    if not files:
+        return
+    terminalreporter.write_sep("-", "browser startup per worker")
+    for name in files:
+        with open(os.path.join(STARTUP_DIR, name)) as f:
+            stats = json.load(f)
+        launches = stats["launches"]
+        launch = [l["launch_s"] for l in launches]
+        resolve = [l["resolve_s"] for l in launches]
+        mode = "fast" if all(l["fast"] for l in launches) else "mixed" if any(l["fast"] for l in launches) else "full"
+        terminalreporter.write_line(
+            f"{stats['worker']:<10} {len(launches)} launches ({mode}): launch avg {sum(launch) / len(launch):.2f}s "
+            f"max {max(launch):.2f}s, driver resolve total {sum(resolve):.2f}s"
+        )
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not hasattr(config, "workerinput"):
+        _write_startup_summary(terminalreporter)
+    slowest = [row for row in COMMAND_HISTOGRAM.summary() if "[" not in row["name"]][:10]
+    if slowest:
+        terminalreporter.write_sep("-", "webdriver commands (top methods by total time)")
+        for row in slowest:
+            terminalreporter.write_line(
+                f"{row['name']:<45} n={row['count']:<5} total={row['total_ms'] / 1000:7.2f}s "
+                f"p50={row['p50_ms']:.0f}ms p95={row['p95_ms']:.0f}ms p99={row['p99_ms']:.0f}ms"
+            )
+        terminalreporter.write_line(f"Full histogram: {COMMANDS_FILE}")
+    if PERF.enabled and not hasattr(config, "workerinput"):
+        results = PERF.run_report()
+        if results:
+            terminalreporter.write_sep("-", "browser timings (p95 vs baseline)")
+            for result in results:
+                regressed = result.delta is not None and result.delta > 0.1 * result.baseline
+                if result.metric == "transition" or regressed:
+                    terminalreporter.write_line(("REGRESSION " if regressed else "") + str(result))
+        if config.getoption("--perf-update-baseline"):
+            PERF.store.save_baseline(config.getoption("--perf-history"))
+            terminalreporter.write_line(f"Baseline updated: {PERF.store.baseline_path}")
+    if JOURNEY_TOTALS["replayed"] or JOURNEY_TOTALS["restored"]:
+        terminalreporter.write_sep("-", "journeys")
+        terminalreporter.write_line(
+            f"{JOURNEY_TOTALS['replayed']} steps driven through the UI, "
+            f"{JOURNEY_TOTALS['restored']} restored from shared-prefix snapshots"
+        )
+    if not WAIT_TIMES:
+        return
+    budget = config.getoption("--wait-budget")
+    total = sum(t for t, _, _ in WAIT_TIMES.values())
+    terminalreporter.write_sep("-", "wait time")
+    terminalreporter.write_line(f"Total time in explicit waits: {total:.1f}s across {len(WAIT_TIMES)} tests")
+    for nodeid, (spent, count, slowest) in sorted(WAIT_TIMES.items(), key=lambda kv: -kv[1][0]):
+        if spent <= budget:
+            break
+        detail = f"; slowest {slowest[0]} {slowest[1]:.1f}s" if slowest else ""
+        terminalreporter.write_line(f"OVER BUDGET {spent:.1f}s > {budget:.1f}s ({count} waits{detail}): {nodeid}")
+
+# --- Incremental runs and the journey prefix tree ---
+def pytest_collection_modifyitems(config, items):
+    if OUTCOME_CACHE is not None and APP_FINGERPRINT:
+        _skip_unchanged(config, items)
+    failed = set()
+    if OUTCOME_CACHE is not None:
+        failed = {item.nodeid for item in items if OUTCOME_CACHE.failed(item.nodeid)}
+        # Earlier failures first; the sort is stable, so everything else keeps its order
+        items.sort(key=lambda item: item.nodeid not in failed)
+    _plan_journeys(items, failed)
+
+def _skip_unchanged(config, items):
+    """Fingerprint each test and skip those that passed last time against the same fingerprint.
+
+    Every process computes the same fingerprints; they travel to the main
+    process in the reports, where the outcomes are recorded.
+    """
+    shared = files_fingerprint(SHARED_SOURCES + BASELINES, BASE_DIR)
+    options = repr([config.getoption(name) for name in BEHAVIOUR_OPTIONS])
+    modules = {}
+    for item in items:
+        module = str(item.path)
+        if module not in modules:
+            modules[module] = files_fingerprint([module], BASE_DIR)
+        fingerprint = combine(APP_FINGERPRINT, shared, options, modules[module])
+        item.user_properties.append(("fingerprint", fingerprint))
+        run_id = None if config.getoption("--full-run") else OUTCOME_CACHE.unchanged_pass(item.nodeid, fingerprint)
+        if run_id:
+            item.add_marker(pytest.mark.cached)
+            item.add_marker(pytest.mark.skip(reason=f"unchanged since it passed in run {run_id} (--incremental)"))
+
+def _plan_journeys(items, failed=()):
+    """Build the journey tree and run each user's journey tests depth-first through it.
+
+    Only journey tests move, and only among the slots they already occupy, so
+    tests sharing a prefix run back to back on the worker holding its snapshot.
+    Users with a test in `failed` (node ids) take the first slots.
+    """
+    slots, keyed = [], []
+    for index, item in enumerate(items):
+        marker = item.get_closest_marker("journey")
+        params = getattr(item, "callspec", None)
+        if marker is None or params is None or "username" not in params.params:
+            continue
+        if item.get_closest_marker("skip"):
+            # Never drives its prefix, so it neither counts towards the tree nor moves
+            continue
+        try:
+            steps = validate(marker.args)
+        except ValueError as e:
+            raise pytest.UsageError(f"{item.nodeid}: {e}")
+        username = params.params["username"]
+        JOURNEY_TREE.add(username, steps)
+        slots.append(index)
+        keyed.append(((username, steps), item))
+    retried = {username for (username, _), item in keyed if item.nodeid in failed}
+    keyed.sort(key=lambda pair: (pair[0][0] not in retried, pair[0]))
+    for index, (_, item) in zip(slots, keyed):
+        items[index] = item
+
+# --- Reporting setup ---
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    # Give xdist workers the main process's run id so their samples line up
+    node.workerinput["swag_run_id"] = timestamp
+    node.workerinput["swag_app_fingerprint"] = APP_FINGERPRINT
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if not config.getoption("--schedule-by-duration"):
+        return None
+    from utils.scheduler import DurationScheduling
+    return DurationScheduling(config, log, timings=TIMING_STORE, users=USERS)
+
+def _app_fingerprint(config):
+    """Hash of the app build under test, or None (and a full run) when it can't be fetched"""
+    if config.getoption("--local-app"):
+        return files_fingerprint([LOCAL_APP_DIR], BASE_DIR)
+    try:
+        return app_fingerprint(config.getoption("--base-url"))
+    except OSError as e:
+        print(f"\n[WARN] Could not fingerprint {config.getoption('--base-url')} ({e}); running every test")
+        return None
 
-# --- Pytest-html integration ---
 def pytest_configure(config):
-    config.option.htmlpath = REPORT_FILE
-    config.option.self_contained_html = True
-    print(f"\n[INFO] HTML report will be saved to: {REPORT_FILE}")
+    global RESULT_STREAM, TIMING_STORE, RUN_ID, ASSET_CACHE, OUTCOME_CACHE, APP_FINGERPRINT
+    RUN_ID = getattr(config, "workerinput", {}).get("swag_run_id", timestamp)
+    SCREENSHOT_STORE.run_id = RUN_ID
+    FLIGHT.resize(config.getoption("--flight-actions"))
+    if config.getoption("--perf"):
+        PERF.configure(PerfStore(PERF_DIR), RUN_ID, config.getoption("--perf-history"))
+    config.addinivalue_line("markers", "blocked: test is blocked by a known issue and counted as BLOCKED")
+    config.addinivalue_line("markers", "visual: test compares rendering and needs a full-fidelity browser even with --fast")
+    config.addinivalue_line("markers", "network(policy): request blocking for this test, 'full' or 'lean' (see utils/network.py)")
+    config.addinivalue_line("markers", "cached: skipped by --incremental, counted as CACHED")
+    config.addinivalue_line("markers", "journey(*steps): start state for the journey fixture, e.g. 'inventory', 'add:<product>', 'cart' (see utils/journeys.py)")
+    if not config.getoption("--no-asset-cache"):
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+        ASSET_CACHE = AssetCacheDirs(os.path.join(config.getoption("--asset-cache-dir"), worker))
+    if config.getoption("--incremental"):
+        OUTCOME_CACHE = OutcomeCache(config.getoption("--incremental-cache"))
+        # Fetched once by the main process and handed to the workers
+        if hasattr(config, "workerinput"):
+            APP_FINGERPRINT = config.workerinput.get("swag_app_fingerprint")
+        else:
+            APP_FINGERPRINT = _app_fingerprint(config)
+    # xdist workers forward their reports to the main process, which owns the stream
+    if not hasattr(config, "workerinput"):
+        RESULT_STREAM = ResultStream(RESULTS_FILE)
+        TIMING_STORE = TimingStore(config.getoption("--timings-file"))
+        print(f"\n[INFO] Streaming results to: {RESULTS_FILE}")
@@ -0,0 +1,18 @@
+# data/users.py
+# Accounts exposed by Swag Labs, shared by the tests and the harness fixtures.
+
+USERS = {
+    "standard_user": "secret_sauce",
+    "locked_out_user": "secret_sauce",
+    "problem_user": "secret_sauce",
+    "performance_glitch_user": "secret_sauce",
+    "error_user": "secret_sauce",
+    "visual_user": "secret_sauce",
+}
+
+INVALID_USERS = {
+    "wrong_user": "secret_sauce"
+}
+
+# Users the app refuses to log in
+LOCKED_USERS = ["locked_out_user"]
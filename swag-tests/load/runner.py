@@ -0,0 +1,271 @@
+# load/runner.py
+# Load generator: concurrent headless shoppers running the page-object journeys.
+#
+#   python -m load.runner --sessions 8 --duration 120 --ramp-up 20 --think 1.0 --mix standard_user=3 --mix problem_user=1
+#
+# Without --base-url it starts the local stand-in (local_app/server.py) and drives that.
+import argparse
+import datetime
+import json
+import math
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
+from data.users import USERS, LOCKED_USERS
+from local_app.server import PROFILES, LocalSwagServer, parse_user_profiles
+from pages.inventory_page import InventoryPage
+from utils.browser_contexts import BrowserContexts, UserSession
+from utils.browser_startup import DriverCache, apply_fast_profile
+from utils.network import POLICIES, apply_policy
+from utils.stats import percentile
+from utils.waits import SCRIPT_TIMEOUT
+
+BASE_DIR = os.path.dirname(os.path.dirname(__file__))
+REPORTS_DIR = os.path.join(BASE_DIR, "reports", "load")
+DRIVER_CACHE = DriverCache(os.path.join(BASE_DIR, ".driver_cache"))
+
+STEPS = ["login", "add_to_cart", "cart", "checkout", "logout"]
+PRODUCTS = list(InventoryPage.PRODUCT_IDS)
+
+
+class LoadStats:
+    """Step latencies, errors and journey outcomes, shared by all virtual users"""
+
+    def __init__(self):
+        self.latencies = {step: [] for step in STEPS}
+        self.errors = dict.fromkeys(STEPS, 0)
+        self.messages = {}
+        self.users = {}
+        self.started = None
+        self.finished = None
+        self._lock = threading.Lock()
+
+    def step(self, name, seconds, error=None):
+        with self._lock:
+            self.latencies[name].append(seconds * 1000)
+            if error:
+                self.errors[name] += 1
+                key = f"{name}: {error}"
+                self.messages[key] = self.messages.get(key, 0) + 1
+
+    def journey(self, username, ok):
+        with self._lock:
+            done, failed = self.users.get(username, (0, 0))
+            self.users[username] = (done + 1, failed + (not ok))
+            self.finished = time.monotonic()
+
+    def summary(self):
+        elapsed = (self.finished - self.started) if self.started and self.finished else 0
+        journeys = sum(done for done, _ in self.users.values())
+        failed = sum(f for _, f in self.users.values())
+        steps = []
+        for name in STEPS:
+            values = sorted(self.latencies[name])
+            if not values:
+                continue
+            steps.append({
+                "step": name,
+                "count": len(values),
+                "errors": self.errors[name],
+                "error_rate": round(self.errors[name] / len(values), 4),
+                "p50_ms": round(percentile(values, 50), 1),
+                "p95_ms": round(percentile(values, 95), 1),
+                "p99_ms": round(percentile(values, 99), 1),
+                "max_ms": round(values[-1], 1),
+            })
+        return {
+            "elapsed_s": round(elapsed, 1),
+            "journeys": journeys,
+            "failed": failed,
+            "error_rate": round(failed / journeys, 4) if journeys else 0,
+            "journeys_per_min": round((journeys - failed) / elapsed * 60, 2) if elapsed else 0,
+            "steps": steps,
+            "users": {u: {"journeys": d, "failed": f} for u, (d, f) in sorted(self.users.items())},
+            "errors": dict(sorted(self.messages.items(), key=lambda kv: -kv[1])),
+        }
+
+
+def launch_browser(headless=True):
+    """Headless Chrome with the lean startup profile"""
+    options = ChromeOptions()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--window-size=1400,900")
+    options.add_experimental_option("prefs", {"credentials_enable_service": False, "profile.password_manager_enabled": False})
+    apply_fast_profile(options)
+    path = DRIVER_CACHE.resolve()
+    drv = webdriver.Chrome(service=ChromeService(path) if path else ChromeService(), options=options)
+    drv.implicitly_wait(0)
+    drv.set_script_timeout(SCRIPT_TIMEOUT)
+    return drv
+
+
+def parse_mix(pairs):
+    """['user=weight', ...] -> {'user': weight}; every user that can log in, equally, by default"""
+    if not pairs:
+        return {user: 1.0 for user in USERS if user not in LOCKED_USERS}
+    mix = {}
+    for pair in pairs:
+        user, _, weight = pair.partition("=")
+        if user not in USERS:
+            raise ValueError(f"Unknown user '{user}' (choose from {', '.join(USERS)})")
+        mix[user] = float(weight or 1)
+    return mix
+
+
+def _login(session):
+    drv = session.driver
+    # Drop the previous journey's session; storage is off limits on about:blank
+    drv.delete_all_cookies()
+    drv.execute_script("try { window.localStorage.clear(); } catch (e) {}")
+    session.login.load()
+    session.login.login(session.username, USERS[session.username])
+    session.login.wait_for_inventory(timeout=30)
+
+
+def _checkout(session):
+    session.checkout.start_checkout()
+    session.checkout.fill_info("Load", "Test", "00100")
+    session.checkout.continue_checkout()
+    session.checkout.finish_checkout()
+    if not session.checkout.is_complete():
+        raise AssertionError("checkout did not complete")
+
+
+def run_journey(session, rng, think, stats):
+    """Login -> add to cart -> cart -> checkout -> logout; stops at the first failing step"""
+    actions = {
+        "login": lambda: _login(session),
+        "add_to_cart": lambda: session.inventory.add_product_to_cart(rng.choice(PRODUCTS)),
+        "cart": session.inventory.go_to_cart,
+        "checkout": lambda: _checkout(session),
+        "logout": session.login.logout,
+    }
+    for name in STEPS:
+        start = time.perf_counter()
+        try:
+            actions[name]()
+        except Exception as e:
+            stats.step(name, time.perf_counter() - start, error=type(e).__name__)
+            return False
+        stats.step(name, time.perf_counter() - start)
+        if think:
+            time.sleep(rng.uniform(0.5 * think, 1.5 * think))
+    return True
+
+
+def virtual_user(index, driver, base_url, args, mix, stats, start_delay, deadline):
+    rng = random.Random(args.seed + index)
+    time.sleep(start_delay)
+    users, weights = list(mix), list(mix.values())
+    journeys = 0
+    while time.monotonic() < deadline and (args.journeys is None or journeys < args.journeys):
+        username = rng.choices(users, weights)[0]
+        # Fresh page objects per journey, so no element handles outlive their document
+        session = UserSession(driver, username, base_url)
+        stats.journey(username, run_journey(session, rng, args.think, stats))
+        journeys += 1
+
+
+def run(args, base_url):
+    mix = parse_mix(args.mix)
+    per_browser = max(1, args.contexts_per_browser)
+    browsers = math.ceil(args.sessions / per_browser)
+    print(f"Launching {browsers} browser(s) for {args.sessions} session(s) against {base_url}")
+    with ThreadPoolExecutor(max_workers=browsers) as executor:
+        parents = list(executor.map(lambda _: launch_browser(not args.headed), range(browsers)))
+
+    contexts = [BrowserContexts(drv) for drv in parents] if per_browser > 1 else []
+    drivers = []
+    for i in range(args.sessions):
+        drv = contexts[i // per_browser].open() if contexts else parents[i]
+        apply_policy(drv, args.network_policy)
+        drivers.append(drv)
+
+    stats = LoadStats()
+    stats.started = time.monotonic()
+    deadline = stats.started + args.ramp_up + args.duration
+    threads = []
+    for i, drv in enumerate(drivers):
+        # Spread session starts evenly over the ramp-up period
+        delay = args.ramp_up * i / args.sessions
+        thread = threading.Thread(
+            target=virtual_user, args=(i, drv, base_url, args, mix, stats, delay, deadline),
+            name=f"vu-{i}", daemon=True,
+        )
+        thread.start()
+        threads.append(thread)
+    try:
+        for thread in threads:
+            thread.join()
+    finally:
+        for ctx in contexts:
+            ctx.close_all()
+        for drv in parents:
+            try:
+                drv.quit()
+            except Exception:
+                pass
+    return stats
+
+
+def print_summary(summary):
+    print(f"\n{summary['journeys']} journeys in {summary['elapsed_s']}s: "
+          f"{summary['journeys_per_min']} journeys/min, {summary['failed']} failed ({summary['error_rate']:.1%})")
+    print(f"{'step':<12} {'count':>6} {'errors':>7} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+    for row in summary["steps"]:
+        print(f"{row['step']:<12} {row['count']:>6} {row['errors']:>7} {row['p50_ms']:>6.0f}ms "
+              f"{row['p95_ms']:>6.0f}ms {row['p99_ms']:>6.0f}ms {row['max_ms']:>6.0f}ms")
+    for user, counts in summary["users"].items():
+        print(f"  {user:<26} {counts['journeys']:>5} journeys, {counts['failed']} failed")
+    for message, count in list(summary["errors"].items())[:10]:
+        print(f"  {count:>5} x {message}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive concurrent synthetic shoppers through the Swag Labs journeys")
+    parser.add_argument("--sessions", type=int, default=4, help="Concurrent virtual users")
+    parser.add_argument("--contexts-per-browser", type=int, default=1, help="Virtual users sharing one Chrome through isolated browser contexts")
+    parser.add_argument("--duration", type=float, default=60, help="Seconds to keep starting journeys once ramp-up is over")
+    parser.add_argument("--journeys", type=int, default=None, help="Stop each virtual user after this many journeys")
+    parser.add_argument("--ramp-up", type=float, default=10, help="Seconds over which virtual users are started")
+    parser.add_argument("--think", type=float, default=1.0, help="Mean pause between steps in seconds (uniform 0.5x-1.5x)")
+    parser.add_argument("--mix", action="append", metavar="USER=WEIGHT", help="User mix drawn from data.users.USERS")
+    parser.add_argument("--base-url", default=None, help="App to load; defaults to a local stand-in started for the run")
+    parser.add_argument("--latency", choices=sorted(PROFILES), default="none", help="Default latency profile for the local stand-in")
+    parser.add_argument("--user-profile", action="append", metavar="USER=PROFILE", help="Per-user latency profile for the local stand-in")
+    parser.add_argument("--network-policy", choices=sorted(POLICIES), default="full", help="Requests blocked in every session ('lean' blocks images, fonts and analytics)")
+    parser.add_argument("--headed", action="store_true", help="Show the browsers")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for user mix, products and think time")
+    parser.add_argument("--output", default=None, help="JSON summary path (default reports/load/load_<timestamp>.json)")
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        server = LocalSwagServer(latency=args.latency, user_profiles=parse_user_profiles(args.user_profile)).start()
+        base_url = server.url
+    try:
+        stats = run(args, base_url)
+    finally:
+        if server:
+            server.stop()
+
+    summary = stats.summary()
+    summary["config"] = {k: v for k, v in vars(args).items() if k != "output"}
+    print_summary(summary)
+    timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    output = args.output or os.path.join(REPORTS_DIR, f"load_{timestamp}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(summary, f, indent=2)
+    print(f"Summary written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+# local_app/server.py
+# Offline stand-in for https://www.saucedemo.com/ with per-user latency profiles.
+#
+#   python -m local_app.server --port 8000 --latency wan --user-profile performance_glitch_user=glitch
+import argparse
+import functools
+import os
+import random
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+STATIC_DIR = os.path.join(os.path.dirname(__file__), "static")
+ASSET_MAX_AGE = 3600
+
+
+class LatencyProfile:
+    """Delay added before each response: base +/- jitter ms, plus page_ms for HTML documents"""
+
+    def __init__(self, base_ms=0, jitter_ms=0, page_ms=0):
+        self.base_ms = base_ms
+        self.jitter_ms = jitter_ms
+        self.page_ms = page_ms
+
+    def delay(self, rng, is_page):
+        ms = self.base_ms + (rng.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0)
+        if is_page:
+            ms += self.page_ms
+        return max(ms, 0) / 1000
+
+
+PROFILES = {
+    "none": LatencyProfile(),
+    "lan": LatencyProfile(base_ms=2, jitter_ms=2),
+    "wan": LatencyProfile(base_ms=60, jitter_ms=30),
+    "mobile": LatencyProfile(base_ms=150, jitter_ms=80, page_ms=200),
+    "glitch": LatencyProfile(base_ms=5, jitter_ms=5, page_ms=2500),
+}
+
+# Mirrors the real app, where performance_glitch_user gets slow page loads
+DEFAULT_USER_PROFILES = {"performance_glitch_user": "glitch"}
+
+
+class SwagRequestHandler(SimpleHTTPRequestHandler):
+    def __init__(self, *args, app=None, **kwargs):
+        self.app = app
+        super().__init__(*args, directory=STATIC_DIR, **kwargs)
+
+    def _username(self):
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        morsel = cookie.get("session-username")
+        return morsel.value if morsel else None
+
+    def _is_page(self):
+        path = self.path.split("?", 1)[0]
+        return path == "/" or path.endswith(".html")
+
+    def do_GET(self):
+        time.sleep(self.app.delay_for(self._username(), self._is_page()))
+        super().do_GET()
+
+    def end_headers(self):
+        # Like the real site: documents are revalidated, static assets can be cached
+        self.send_header("Cache-Control", "no-cache" if self._is_page() else f"public, max-age={ASSET_MAX_AGE}")
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalSwagServer:
+    """Serves local_app/static on localhost from a background thread"""
+
+    def __init__(self, host="127.0.0.1", port=0, latency="none", user_profiles=None, seed=0):
+        self.default_profile = PROFILES[latency]
+        self.user_profiles = dict(DEFAULT_USER_PROFILES)
+        self.user_profiles.update(user_profiles or {})
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        handler = functools.partial(SwagRequestHandler, app=self)
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def delay_for(self, username, is_page):
+        profile = PROFILES[self.user_profiles[username]] if username in self.user_profiles else self.default_profile
+        with self._rng_lock:
+            return profile.delay(self._rng, is_page)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="local-swag-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def parse_user_profiles(pairs):
+    """['user=profile', ...] -> {'user': 'profile'}"""
+    mapping = {}
+    for pair in pairs or []:
+        user, _, profile = pair.partition("=")
+        if profile not in PROFILES:
+            raise ValueError(f"Unknown latency profile '{profile}' (choose from {', '.join(PROFILES)})")
+        mapping[user] = profile
+    return mapping
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Swag Labs stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", choices=sorted(PROFILES), default="none", help="Default latency profile")
+    parser.add_argument("--user-profile", action="append", metavar="USER=PROFILE", help="Per-user latency profile")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for latency jitter")
+    args = parser.parse_args()
+
+    server = LocalSwagServer(args.host, args.port, args.latency, parse_user_profiles(args.user_profile), args.seed)
+    print(f"Serving Swag Labs stand-in at {server.url} (latency: {args.latency})")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
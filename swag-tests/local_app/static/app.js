@@ -0,0 +1,229 @@
+// Local stand-in for the Swag Labs front end. Reproduces the element ids, classes,
+// texts and per-user quirks the page objects rely on.
+const PASSWORD = "secret_sauce";
+const USERS = {
+    standard_user: {},
+    locked_out_user: { locked: true },
+    problem_user: { brokenImages: true },
+    performance_glitch_user: {},
+    error_user: { brokenRemove: true },
+    visual_user: { visualGlitch: true },
+};
+const PRODUCTS = [
+    { id: 4, name: "Sauce Labs Backpack", price: 29.99, desc: "Carry all the things." },
+    { id: 0, name: "Sauce Labs Bike Light", price: 9.99, desc: "A red light isn't the desired state in testing." },
+    { id: 1, name: "Sauce Labs Bolt T-Shirt", price: 15.99, desc: "Get your testing superhero on." },
+    { id: 5, name: "Sauce Labs Fleece Jacket", price: 49.99, desc: "A midweight quarter-zip fleece jacket." },
+    { id: 2, name: "Sauce Labs Onesie", price: 7.99, desc: "Rib snap infant onesie." },
+    { id: 3, name: "Test.allTheThings() T-Shirt (Red)", price: 15.99, desc: "This classic tee features a print." },
+];
+const CART_KEY = "cart-contents";
+
+// --- Session and cart state (same storage as the real app) ---
+function currentUser() {
+    const match = document.cookie.match(/(?:^|; )session-username=([^;]*)/);
+    return match ? decodeURIComponent(match[1]) : null;
+}
+function setUser(name) { document.cookie = `session-username=${encodeURIComponent(name)}; path=/`; }
+function clearUser() { document.cookie = "session-username=; path=/; expires=Thu, 01 Jan 1970 00:00:00 GMT"; }
+function traits() { return USERS[currentUser()] || {}; }
+function getCart() {
+    try { return JSON.parse(localStorage.getItem(CART_KEY)) || []; } catch (e) { return []; }
+}
+function setCart(ids) {
+    if (ids.length) localStorage.setItem(CART_KEY, JSON.stringify(ids));
+    else localStorage.removeItem(CART_KEY);
+    renderBadge();
+}
+function slug(name) { return name.toLowerCase().replace(/[^a-z0-9]+/g, "-").replace(/-+$/, ""); }
+
+function h(tag, attrs, ...children) {
+    const node = document.createElement(tag);
+    for (const [k, v] of Object.entries(attrs || {})) {
+        if (k.startsWith("on")) node.addEventListener(k.slice(2), v);
+        else node.setAttribute(k, v);
+    }
+    for (const child of children) node.append(child);
+    return node;
+}
+
+function requireLogin(path) {
+    if (currentUser()) return true;
+    sessionStorage.setItem("login-error", `Epic sadface: You can only access '${path}' when you are logged in.`);
+    location.href = "./";
+    return false;
+}
+
+// --- Shared header with burger menu and cart link ---
+function renderBadge() {
+    const link = document.querySelector(".shopping_cart_link");
+    if (!link) return;
+    link.querySelector(".shopping_cart_badge")?.remove();
+    const count = getCart().length;
+    if (count) link.append(h("span", { class: "shopping_cart_badge", "data-test": "shopping-cart-badge" }, String(count)));
+}
+function renderHeader(root, title) {
+    const menu = h("div", { class: "bm-menu-wrap" },
+        h("nav", { class: "bm-item-list" },
+            h("a", { id: "inventory_sidebar_link", onclick: () => { location.href = "inventory.html"; } }, "All Items"),
+            h("a", { id: "about_sidebar_link", href: "https://saucelabs.com/" }, "About"),
+            h("a", { id: "logout_sidebar_link", onclick: () => { clearUser(); localStorage.clear(); location.href = "./"; } }, "Logout"),
+            h("a", { id: "reset_sidebar_link", onclick: () => setCart([]) }, "Reset App State"),
+            h("button", { id: "react-burger-cross-btn", onclick: () => menu.classList.remove("open") }, "Close Menu")));
+    const cartClass = traits().visualGlitch ? "shopping_cart_link visual_failure" : "shopping_cart_link";
+    root.append(
+        h("div", { class: "header_container", id: "header_container" },
+            h("button", { id: "react-burger-menu-btn", onclick: () => menu.classList.add("open") }, "Open Menu"),
+            h("div", { class: "app_logo" }, "Swag Labs"),
+            h("a", { class: cartClass, "data-test": "shopping-cart-link", onclick: () => { location.href = "cart.html"; } })),
+        menu,
+        h("span", { class: "title", "data-test": "title" }, title));
+    renderBadge();
+}
+function showError(container, message) {
+    container.replaceChildren(message ? h("h3", { "data-test": "error" }, message) : "");
+}
+
+// --- Pages ---
+function initLogin(root) {
+    const error = h("div", { class: "error-message-container" });
+    const user = h("input", { id: "user-name", "data-test": "username", placeholder: "Username", type: "text" });
+    const pass = h("input", { id: "password", "data-test": "password", placeholder: "Password", type: "password" });
+    const button = h("input", { id: "login-button", "data-test": "login-button", type: "submit", class: "submit-button btn", value: "Login" });
+    const form = h("form", { class: "login_wrapper" }, user, pass, error, button);
+    form.addEventListener("submit", (event) => {
+        event.preventDefault();
+        const name = user.value;
+        if (!name) return showError(error, "Epic sadface: Username is required");
+        if (!pass.value) return showError(error, "Epic sadface: Password is required");
+        if (!(name in USERS) || pass.value !== PASSWORD)
+            return showError(error, "Epic sadface: Username and password do not match any user in this service");
+        if (USERS[name].locked) return showError(error, "Epic sadface: Sorry, this user has been locked out.");
+        setUser(name);
+        location.href = "inventory.html";
+    });
+    root.append(h("div", { class: "login_logo" }, "Swag Labs"), form);
+    showError(error, sessionStorage.getItem("login-error"));
+    sessionStorage.removeItem("login-error");
+}
+
+function cartButton(product, onChange) {
+    const inCart = getCart().includes(product.id);
+    const id = `${inCart ? "remove" : "add-to-cart"}-${slug(product.name)}`;
+    const cls = inCart ? "btn btn_secondary btn_small btn_inventory" : "btn btn_primary btn_small btn_inventory";
+    return h("button", {
+        id, class: cls, "data-test": id, name: id,
+        onclick: () => {
+            const cart = getCart();
+            if (inCart) {
+                if (traits().brokenRemove) return;
+                setCart(cart.filter((x) => x !== product.id));
+            } else {
+                setCart([...cart, product.id]);
+            }
+            onChange();
+        },
+    }, inCart ? "Remove" : "Add to cart");
+}
+
+function initInventory(root) {
+    if (!requireLogin("/inventory.html")) return;
+    renderHeader(root, "Products");
+    const list = h("div", { class: "inventory_list" });
+    for (const product of PRODUCTS) {
+        const src = traits().brokenImages ? "img/sl-404.svg" : `img/item-${product.id}.svg`;
+        const slot = h("div", { class: "pricebar" }, h("div", { class: "inventory_item_price" }, `$${product.price}`));
+        // Replace the button on every toggle, like the real React app does
+        const render = () => slot.replaceChildren(slot.firstChild, cartButton(product, render));
+        render();
+        list.append(h("div", { class: "inventory_item", "data-test": "inventory-item" },
+            h("div", { class: "inventory_item_img" }, h("img", { src, alt: product.name })),
+            h("div", { class: "inventory_item_description" },
+                h("div", { class: "inventory_item_name", "data-test": "inventory-item-name" }, product.name),
+                h("div", { class: "inventory_item_desc" }, product.desc)),
+            slot));
+    }
+    root.append(h("div", { id: "inventory_container", class: "inventory_container" }, list));
+}
+
+function initCart(root) {
+    if (!requireLogin("/cart.html")) return;
+    renderHeader(root, "Your Cart");
+    const list = h("div", { class: "cart_list" });
+    for (const id of getCart()) {
+        const product = PRODUCTS.find((p) => p.id === id);
+        if (!product) continue;
+        const item = h("div", { class: "cart_item" },
+            h("div", { class: "cart_quantity" }, "1"),
+            h("div", { class: "inventory_item_name" }, product.name),
+            h("div", { class: "inventory_item_price" }, `$${product.price}`),
+            h("button", {
+                id: `remove-${slug(product.name)}`, class: "btn btn_secondary btn_small cart_button",
+                onclick: () => {
+                    if (traits().brokenRemove) return;
+                    setCart(getCart().filter((x) => x !== id));
+                    item.remove();
+                },
+            }, "Remove"));
+        list.append(item);
+    }
+    root.append(h("div", { id: "cart_contents_container" }, list,
+        h("div", { class: "cart_footer" },
+            h("button", { id: "continue-shopping", class: "btn", onclick: () => { location.href = "inventory.html"; } }, "Continue Shopping"),
+            h("button", { id: "checkout", class: "btn checkout_button", onclick: () => { location.href = "checkout-step-one.html"; } }, "Checkout"))));
+}
+
+function initCheckoutOne(root) {
+    if (!requireLogin("/checkout-step-one.html")) return;
+    renderHeader(root, "Checkout: Your Information");
+    const error = h("div", { class: "error-message-container" });
+    const first = h("input", { id: "first-name", "data-test": "firstName", placeholder: "First Name" });
+    const last = h("input", { id: "last-name", "data-test": "lastName", placeholder: "Last Name" });
+    const postal = h("input", { id: "postal-code", "data-test": "postalCode", placeholder: "Zip/Postal Code" });
+    const form = h("form", { class: "checkout_info" }, first, last, postal, error,
+        h("input", { id: "continue", type: "submit", class: "submit-button btn", value: "Continue" }));
+    form.addEventListener("submit", (event) => {
+        event.preventDefault();
+        if (!first.value) return showError(error, "Error: First Name is required");
+        if (!last.value) return showError(error, "Error: Last Name is required");
+        if (!postal.value) return showError(error, "Error: Postal Code is required");
+        location.href = "checkout-step-two.html";
+    });
+    root.append(h("div", { id: "checkout_info_container", class: "checkout_info_container" }, form));
+}
+
+function initCheckoutTwo(root) {
+    if (!requireLogin("/checkout-step-two.html")) return;
+    renderHeader(root, "Checkout: Overview");
+    const items = getCart().map((id) => PRODUCTS.find((p) => p.id === id)).filter(Boolean);
+    const total = items.reduce((sum, p) => sum + p.price, 0);
+    root.append(h("div", { id: "checkout_summary_container" },
+        h("div", { class: "cart_list" }, ...items.map((p) =>
+            h("div", { class: "cart_item" }, h("div", { class: "inventory_item_name" }, p.name)))),
+        h("div", { class: "summary_info" },
+            h("div", { class: "summary_subtotal_label" }, `Item total: $${total.toFixed(2)}`)),
+        h("div", { class: "summary_footer" },
+            h("button", { id: "cancel", class: "btn", onclick: () => { location.href = "inventory.html"; } }, "Cancel"),
+            h("button", { id: "finish", class: "btn", onclick: () => { setCart([]); location.href = "checkout-complete.html"; } }, "Finish"))));
+}
+
+function initComplete(root) {
+    if (!requireLogin("/checkout-complete.html")) return;
+    renderHeader(root, "Checkout: Complete!");
+    root.append(h("div", { id: "checkout_complete_container", class: "checkout_complete_container" },
+        h("h2", { class: "complete-header" }, "Thank you for your order!"),
+        h("div", { class: "complete-text" }, "Your order has been dispatched."),
+        h("button", { id: "back-to-products", class: "btn", onclick: () => { location.href = "inventory.html"; } }, "Back Home")));
+}
+
+const PAGES = {
+    login: initLogin,
+    inventory: initInventory,
+    cart: initCart,
+    "checkout-one": initCheckoutOne,
+    "checkout-two": initCheckoutTwo,
+    complete: initComplete,
+};
+document.addEventListener("DOMContentLoaded", () => {
+    PAGES[document.body.dataset.page](document.getElementById("root"));
+});
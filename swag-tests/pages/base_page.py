@@ -0,0 +1,113 @@
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from utils.waits import Waiter
+
+# Resolves a (By, value) pair in the page; shared by the batched scripts below
+FIND_JS = """
+function find(by, value) {
+    switch (by) {
+        case 'id': return document.getElementById(value);
+        case 'css selector': return document.querySelector(value);
+        case 'class name': return document.getElementsByClassName(value)[0] || null;
+        case 'name': return document.getElementsByName(value)[0] || null;
+        case 'tag name': return document.getElementsByTagName(value)[0] || null;
+        case 'xpath': return document.evaluate(
+            value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+"""
+
+RESOLVE_JS = FIND_JS + """
+return arguments[0].map(([by, value]) => find(by, value));
+"""
+
+# Sets values through the native setter and fires input/change so React picks them up
+FILL_JS = FIND_JS + """
+const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+return arguments[0].map(([by, value, text]) => {
+    const el = find(by, value);
+    if (!el) return null;
+    el.focus();
+    setter.call(el, text);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    return el;
+});
+"""
+
+STRATEGIES = {By.ID, By.CSS_SELECTOR, By.CLASS_NAME, By.NAME, By.TAG_NAME, By.XPATH}
+
+
+class BasePage:
+    def __init__(self, driver):
+        self.driver = driver
+        self.wait = Waiter(driver)
+        self._elements = {}
+        # Who the page is driven as, when known; tags perf samples
+        self.username = None
+
+    @classmethod
+    def locators(cls):
+        """All (By, value) locators declared on the page class"""
+        found = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if isinstance(value, tuple) and len(value) == 2 and value[0] in STRATEGIES:
+                    found[name] = value
+        return found
+
+    # --- Element cache ---
+    def element(self, locator):
+        """Return the element for a locator, reusing the handle resolved earlier"""
+        el = self._elements.get(locator)
+        if el is None:
+            el = self.driver.find_element(*locator)
+            self._elements[locator] = el
+        return el
+
+    def forget(self, *locators):
+        """Drop cached handles (all of them when called without arguments)"""
+        if not locators:
+            self._elements.clear()
+        for locator in locators:
+            self._elements.pop(locator, None)
+
+    def _with_element(self, locator, action):
+        try:
+            return action(self.element(locator))
+        except StaleElementReferenceException:
+            self.forget(locator)
+            return action(self.element(locator))
+
+    def click(self, locator):
+        self._with_element(locator, lambda el: el.click())
+
+    def text_of(self, locator):
+        return self._with_element(locator, lambda el: el.text)
+
+    # --- Batched resolution: one execute_script round-trip ---
+    def resolve(self, *locators, required=True):
+        """Resolve several locators at once and cache the found elements"""
+        elements = self.driver.execute_script(RESOLVE_JS, [list(loc) for loc in locators])
+        missing = [loc for loc, el in zip(locators, elements) if el is None]
+        if required and missing:
+            raise NoSuchElementException(f"Unable to locate: {missing}")
+        for loc, el in zip(locators, elements):
+            if el is not None:
+                self._elements[loc] = el
+        return elements
+
+    def preload(self):
+        """Resolve every locator declared on the page that is currently in the DOM"""
+        return self.resolve(*self.locators().values(), required=False)
+
+    def fill_form(self, values):
+        """Replace the value of several inputs in one round-trip; `values` maps locator -> text"""
+        fields = [[by, value, text] for (by, value), text in values.items()]
+        elements = self.driver.execute_script(FILL_JS, fields)
+        missing = [loc for loc, el in zip(values, elements) if el is None]
+        if missing:
+            raise NoSuchElementException(f"Unable to locate: {missing}")
+        for loc, el in zip(values, elements):
+            self._elements[loc] = el
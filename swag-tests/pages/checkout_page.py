@@ -1,12 +1,11 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-
-class CheckoutPage:
-    def __init__(self, driver):
-        self.driver = driver
+from pages.base_page import BasePage
+from utils.perf import PERF
+from utils.waits import SHORT_TIMEOUT
 
+class CheckoutPage(BasePage):
     # Locators
+    checkout_btn = (By.ID, "checkout")
     first_name = (By.ID, "first-name")
     last_name = (By.ID, "last-name")
     postal_code = (By.ID, "postal-code")
@@ -15,32 +14,34 @@ class CheckoutPage:
     complete_header = (By.CLASS_NAME, "complete-header")
     error_msg = (By.CSS_SELECTOR, "h3[data-test='error']")
 
+    def start_checkout(self):
+        """From the cart, open the checkout information step"""
+        PERF.mark(self.driver)
+        self.click(self.checkout_btn)
+        self.wait.present(self.first_name, 5)
+        # The form fields and the continue button in one round-trip
+        self.preload()
+        PERF.capture(self.driver, "checkout-info", self.username)
+
     def fill_info(self, first, last, postal):
-        self.driver.find_element(*self.first_name).clear()
-        self.driver.find_element(*self.first_name).send_keys(first)
-        self.driver.find_element(*self.last_name).clear()
-        self.driver.find_element(*self.last_name).send_keys(last)
-        self.driver.find_element(*self.postal_code).clear()
-        self.driver.find_element(*self.postal_code).send_keys(postal)
+        self.fill_form({self.first_name: first, self.last_name: last, self.postal_code: postal})
 
     def continue_checkout(self):
-        self.driver.find_element(*self.continue_btn).click()
+        PERF.mark(self.driver)
+        self.click(self.continue_btn)
 
     def finish_checkout(self):
-        self.driver.find_element(*self.finish_btn).click()
+        # The overview step has loaded once the finish button is there
+        self.wait.present(self.finish_btn, 5)
+        PERF.capture(self.driver, "checkout-overview", self.username)
+        PERF.mark(self.driver)
+        self.click(self.finish_btn)
 
     def is_complete(self):
-        try:
-            el = WebDriverWait(self.driver, 5).until(
-                EC.visibility_of_element_located(self.complete_header)
-            )
-            return el.is_displayed()
-        except:
-            return False
+        complete = self.wait.is_visible(self.complete_header, 5)
+        if complete:
+            PERF.capture(self.driver, "checkout-complete", self.username)
+        return complete
 
-    def has_error(self):
-        try:
-            el = self.driver.find_element(*self.error_msg)
-            return el.is_displayed()
-        except:
-            return False
+    def has_error(self, timeout=SHORT_TIMEOUT):
+        return self.wait.is_visible(self.error_msg, timeout)
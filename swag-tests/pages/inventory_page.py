@@ -1,36 +1,83 @@
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from pages.base_page import BasePage
+from utils.perf import PERF
+from utils.waits import SHORT_TIMEOUT
 
-class InventoryPage:
-    def __init__(self, driver):
-        self.driver = driver
+PRODUCT_BUTTONS_JS = """
+const buttons = {};
+for (const item of document.querySelectorAll('.inventory_item')) {
+    const name = item.querySelector('.inventory_item_name');
+    const button = item.querySelector('button');
+    if (name && button) buttons[name.textContent.trim()] = button;
+}
+return buttons;
+"""
+
+class InventoryPage(BasePage):
+    PATH = "inventory.html"
+
+    # Item ids used by the app's "cart-contents" localStorage entry
+    PRODUCT_IDS = {
+        "Sauce Labs Bike Light": 0,
+        "Sauce Labs Bolt T-Shirt": 1,
+        "Sauce Labs Onesie": 2,
+        "Test.allTheThings() T-Shirt (Red)": 3,
+        "Sauce Labs Backpack": 4,
+        "Sauce Labs Fleece Jacket": 5,
+    }
 
     # Locators
     cart_badge = (By.CLASS_NAME, "shopping_cart_badge")
     cart_link = (By.CLASS_NAME, "shopping_cart_link")
+    cart_list = (By.CLASS_NAME, "cart_list")
+
+    def __init__(self, driver):
+        super().__init__(driver)
+        self._buttons = None
+
+    def _product_buttons(self):
+        """Map product name -> its cart button, resolved in one round-trip"""
+        if self._buttons is None:
+            self._buttons = self.driver.execute_script(PRODUCT_BUTTONS_JS)
+        return self._buttons
+
+    def _click_product_button(self, product_name, expected_label=None):
+        for _ in range(2):
+            btn = self._product_buttons().get(product_name)
+            if btn is None:
+                raise NoSuchElementException(f"Product not found: {product_name}")
+            try:
+                if expected_label and expected_label not in btn.text:
+                    raise NoSuchElementException(f"No '{expected_label}' button for {product_name}")
+                btn.click()
+                return
+            except StaleElementReferenceException:
+                # The app re-renders the button after each toggle
+                self._buttons = None
+        raise StaleElementReferenceException(f"Button for {product_name} kept going stale")
 
     def add_product_to_cart(self, product_name):
         """Add a product to cart by its name"""
-        btn = self.driver.find_element(By.XPATH, f"//div[text()='{product_name}']/ancestor::div[@class='inventory_item']//button")
-        btn.click()
+        self._click_product_button(product_name)
 
     def remove_product_from_cart(self, product_name):
         """Remove a product from cart by its name"""
-        btn = self.driver.find_element(By.XPATH, f"//div[text()='{product_name}']/ancestor::div[@class='inventory_item']//button[contains(text(),'Remove')]")
-        btn.click()
+        self._click_product_button(product_name, expected_label="Remove")
 
     def get_cart_count(self):
         """Return number of items in cart"""
-        try:
-            count_el = self.driver.find_element(*self.cart_badge)
-            return int(count_el.text)
-        except:
-            return 0
+        # The badge is rendered synchronously, so an empty cart needs no waiting
+        count_el = self.wait.find_now(self.cart_badge)
+        return int(count_el.text) if count_el else 0
+
+    def is_cart_empty(self, timeout=SHORT_TIMEOUT):
+        """Check that the cart badge is gone (it is only rendered for a non-empty cart)"""
+        return self.wait.is_absent(self.cart_badge, timeout)
 
     def go_to_cart(self):
-        self.driver.find_element(*self.cart_link).click()
+        PERF.mark(self.driver)
+        self.click(self.cart_link)
         # wait for cart page to load
-        WebDriverWait(self.driver, 5).until(
-            EC.presence_of_element_located((By.CLASS_NAME, "cart_list"))
-        )
+        self.wait.present(self.cart_list, 5)
+        PERF.capture(self.driver, "cart", self.username)
@@ -1,12 +1,13 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from pages.base_page import BasePage
+from utils.perf import PERF
+from utils.waits import SHORT_TIMEOUT
 
-class LoginPage:
+class LoginPage(BasePage):
     URL = "https://www.saucedemo.com/"
 
     def __init__(self, driver, base_url=None):
-        self.driver = driver
+        super().__init__(driver)
         if base_url:
             self.URL = base_url
 
@@ -23,52 +24,39 @@ class LoginPage:
     # --- Page Actions ---
     def load(self):
         self.driver.get(self.URL)
+        # Form fields and the login button in one round-trip
+        self.preload()
 
     def login(self, username, password):
-        self.driver.find_element(*self.username_input).clear()
-        self.driver.find_element(*self.username_input).send_keys(username)
-        self.driver.find_element(*self.password_input).clear()
-        self.driver.find_element(*self.password_input).send_keys(password)
-        self.driver.find_element(*self.login_button).click()
+        self.username = username
+        self.fill_form({self.username_input: username, self.password_input: password})
+        PERF.mark(self.driver)
+        self.click(self.login_button)
 
     def wait_for_inventory(self, timeout=10):
         """Wait until inventory page is loaded"""
-        return WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located(self.inventory_container)
-        )
+        el = self.wait.present(self.inventory_container, timeout)
+        PERF.capture(self.driver, "inventory", self.username)
+        return el
 
     def get_error_text(self, timeout=5):
         """Return error message if visible"""
-        try:
-            el = WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(self.error_container)
-            )
-            return el.text.strip()
-        except:
-            return None
+        if self.wait.is_visible(self.error_container, timeout):
+            return self.text_of(self.error_container).strip()
+        return None
 
-    def is_menu_present(self):
+    def is_menu_present(self, timeout=SHORT_TIMEOUT):
         """Check if the menu button is visible"""
-        try:
-            return self.driver.find_element(*self.menu_button).is_displayed()
-        except:
-            return False
+        return self.wait.is_visible(self.menu_button, timeout)
 
     def logout(self, timeout=5):
         """Logout from the app"""
         if self.is_menu_present():
-            self.driver.find_element(*self.menu_button).click()
-            WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable(self.logout_link)
-            ).click()
+            self.click(self.menu_button)
+            self.wait.clickable(self.logout_link, timeout).click()
             # wait until login button is visible again
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(self.login_button)
-            )
+            self.wait.visible(self.login_button, timeout)
 
-    def is_login_button_present(self):
+    def is_login_button_present(self, timeout=SHORT_TIMEOUT):
         """Check if login button is visible (after logout)"""
-        try:
-            return self.driver.find_element(*self.login_button).is_displayed()
-        except:
-            return False
+        return self.wait.is_visible(self.login_button, timeout)
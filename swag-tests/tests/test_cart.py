@@ -3,10 +3,9 @@ from pages.inventory_page import InventoryPage
 
 PRODUCTS = ["Sauce Labs Backpack", "Sauce Labs Bike Light"]
 
-@pytest.mark.parametrize("username,password", [("standard_user", "secret_sauce")])
-def test_add_remove_products(login_page, username, password):
-    login_page.load()
-    login_page.login(username, password)
+@pytest.mark.parametrize("username", ["standard_user"])
+def test_add_remove_products(logged_in_as, username):
+    login_page = logged_in_as(username)
     assert login_page.wait_for_inventory()
 
     inventory = InventoryPage(login_page.driver)
@@ -21,4 +20,4 @@ def test_add_remove_products(login_page, username, password):
     for product in PRODUCTS:
         inventory.remove_product_from_cart(product)
 
-    assert inventory.get_cart_count() == 0, "Cart not empty after removing"
+    assert inventory.is_cart_empty(), "Cart not empty after removing"
@@ -1,18 +1,9 @@
 import pytest
-from pages.inventory_page import InventoryPage
-from pages.checkout_page import CheckoutPage
 
-@pytest.mark.parametrize("username,password", [("standard_user", "secret_sauce")])
-def test_checkout_flow(login_page, username, password):
-    login_page.load()
-    login_page.login(username, password)
-    assert login_page.wait_for_inventory()
-
-    inventory = InventoryPage(login_page.driver)
-    inventory.add_product_to_cart("Sauce Labs Backpack")
-    inventory.go_to_cart()
-
-    checkout = CheckoutPage(login_page.driver)
+@pytest.mark.journey("inventory", "add:Sauce Labs Backpack", "cart", "checkout-info")
+@pytest.mark.parametrize("username", ["standard_user"])
+def test_checkout_flow(journey, username):
+    checkout = journey.checkout
 
     # Negative: missing info
     checkout.continue_checkout()
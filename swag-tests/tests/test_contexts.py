@@ -0,0 +1,26 @@
+from concurrent.futures import ThreadPoolExecutor
+from pages.inventory_page import InventoryPage
+
+# Each user starts with a different cart so leaked storage would show up in the count
+CARTS = {
+    "standard_user": ["Sauce Labs Backpack"],
+    "performance_glitch_user": ["Sauce Labs Backpack", "Sauce Labs Bike Light"],
+    "visual_user": ["Sauce Labs Backpack", "Sauce Labs Bike Light", "Sauce Labs Onesie"],
+}
+
+def test_users_isolated_in_one_browser(user_sessions):
+    sessions = [user_sessions(username, cart=cart) for username, cart in CARTS.items()]
+
+    def journey(session):
+        assert session.login.wait_for_inventory(timeout=40)
+        session.inventory.add_product_to_cart("Sauce Labs Fleece Jacket")
+        session.inventory.go_to_cart()
+        cookie = session.driver.get_cookie("session-username")
+        return cookie["value"], session.inventory.get_cart_count()
+
+    with ThreadPoolExecutor(max_workers=len(sessions)) as executor:
+        results = list(executor.map(journey, sessions))
+
+    for (username, cart), (session_user, count) in zip(CARTS.items(), results):
+        assert session_user == username, f"{username} saw {session_user}'s session"
+        assert count == len(cart) + 1, f"Cart count mismatch for {username}"
@@ -1,43 +1,30 @@
 # tests/test_login.py
-import os
 import time
 import pytest
-from PIL import Image, ImageChops
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from data.users import USERS, INVALID_USERS
 
-USERS = {
-    "standard_user": "secret_sauce",
-    "locked_out_user": "secret_sauce",
-    "problem_user": "secret_sauce",
-    "performance_glitch_user": "secret_sauce",
-    "error_user": "secret_sauce",
-    "visual_user": "secret_sauce",
-}
+# p95 budget (ms) for the login -> inventory transition, checked when run with --perf
+INVENTORY_BUDGET_MS = {"performance_glitch_user": 8000}
+DEFAULT_INVENTORY_BUDGET_MS = 3000
 
-INVALID_USERS = {
-    "wrong_user": "secret_sauce"
-}
+# Users without a working cart, skipped before their journey prefix is driven
+NO_CART_USERS = ["locked_out_user", "error_user"]
 
-# ---------- Visual regression helper ----------
-def compare_images(baseline_path, current_path, diff_path):
-    im1 = Image.open(baseline_path).convert("RGBA")
-    im2 = Image.open(current_path).convert("RGBA")
 
-    if im1.size != im2.size:
-        im2 = im2.resize(im1.size)
-
-    diff = ImageChops.difference(im1, im2)
-    if diff.getbbox() is None:
-        return True
-
-    diff.save(diff_path)
-    return False
+def cart_users(reason):
+    return [
+        pytest.param(u, marks=pytest.mark.skip(reason=f"{u} {reason}")) if u in NO_CART_USERS else u
+        for u in USERS
+    ]
 
 # ---------- LOGIN TESTS ----------
-@pytest.mark.parametrize("username,password", [(u, p) for u, p in USERS.items()])
-def test_valid_login(login_page, username, password, screenshot_dir):
+@pytest.mark.parametrize("username,password", [
+    pytest.param(u, p, marks=pytest.mark.visual) if u == "visual_user" else (u, p) for u, p in USERS.items()
+])
+def test_valid_login(login_page, username, password, layout_check, perf_budget):
     timeout = 40 if username in ["performance_glitch_user", "problem_user", "error_user"] else 15
 
     login_page.load()
@@ -66,22 +53,11 @@ def test_valid_login(login_page, username, password, screenshot_dir):
     elapsed = time.time() - start
     if username == "performance_glitch_user":
         assert elapsed < 35, f"Login took too long: {elapsed:.1f}s"
+    perf_budget("inventory", p95_ms=INVENTORY_BUDGET_MS.get(username, DEFAULT_INVENTORY_BUDGET_MS))
 
-    # Visual regression check
+    # Visual regression check: layout fingerprint, pixel diff only when it changed
     if username == "visual_user":
-        baseline_path = os.path.join(screenshot_dir, "visual_user_baseline.png")
-        current_path = os.path.join(screenshot_dir, "visual_user_current.png")
-        diff_path = os.path.join(screenshot_dir, "visual_user_diff.png")
-
-        os.makedirs(screenshot_dir, exist_ok=True)
-        login_page.driver.save_screenshot(current_path)
-
-        if not os.path.exists(baseline_path):
-            os.rename(current_path, baseline_path)
-            pytest.xfail("Baseline image created for visual_user. Re-run to compare.")
-
-        identical = compare_images(baseline_path, current_path, diff_path)
-        assert identical, f"Visual diff detected for visual_user. See {diff_path}"
+        layout_check(login_page.driver, username, "inventory")
 
 # ---------- INVALID LOGIN TESTS ----------
 @pytest.mark.parametrize("username,password", [(u, p) for u, p in INVALID_USERS.items()])
@@ -95,13 +71,12 @@ def test_invalid_login(login_page, username, password, screenshot_dir):
     assert err, f"Expected error message for invalid login: {username}"
 
 # ---------- MENU VERIFICATION TEST ----------
-@pytest.mark.parametrize("username,password", [(u, p) for u, p in USERS.items()])
-def test_menu_and_logout(login_page, username, password):
+@pytest.mark.parametrize("username", list(USERS))
+def test_menu_and_logout(logged_in_as, username):
     if username == "locked_out_user":
         pytest.skip(f"{username} cannot log in; skipping menu test")
 
-    login_page.load()
-    login_page.login(username, password)
+    login_page = logged_in_as(username)
     login_page.wait_for_inventory(timeout=15)
 
     # Verify menu button
@@ -119,22 +94,12 @@ def test_menu_and_logout(login_page, username, password):
     assert login_page.is_login_button_present(), f"{username} failed to logout"
 
 # ---------- CART TESTS ----------
-@pytest.mark.parametrize("username,password", [(u, p) for u, p in USERS.items()])
-def test_add_remove_products(login_page, username, password):
-    if username in ["locked_out_user", "error_user"]:
-        pytest.skip(f"{username} cannot perform cart operations")
-
-    login_page.load()
-    login_page.login(username, password)
-    login_page.wait_for_inventory(timeout=15)
+@pytest.mark.journey("inventory", "add:Sauce Labs Backpack", "add:Sauce Labs Bike Light", "cart")
+@pytest.mark.parametrize("username", cart_users("cannot perform cart operations"))
+def test_add_remove_products(journey, username):
+    login_page = journey.login
 
-    # Add first 2 products to cart
-    add_buttons = login_page.driver.find_elements(By.CSS_SELECTOR, ".inventory_item button")
-    for btn in add_buttons[:2]:
-        btn.click()
-
-    # Go to cart
-    login_page.driver.find_element(By.CSS_SELECTOR, ".shopping_cart_link").click()
+    # The journey added the first 2 products and opened the cart
     cart_items = WebDriverWait(login_page.driver, 10).until(
         EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".cart_item"))
     )
@@ -152,26 +117,12 @@ def test_add_remove_products(login_page, username, password):
     assert len(cart_items) == 0, f"{username} cart not empty after removing"
 
 # ---------- CHECKOUT FLOW ----------
-@pytest.mark.parametrize("username,password", [(u, p) for u, p in USERS.items()])
-def test_checkout_flow(login_page, username, password):
-    if username in ["locked_out_user", "error_user"]:
-        pytest.skip(f"{username} cannot perform checkout")
-
-    login_page.load()
-    login_page.login(username, password)
-    login_page.wait_for_inventory(timeout=15)
-
-    # Add first product to cart
-    login_page.driver.find_element(By.CSS_SELECTOR, ".inventory_item button").click()
-
-    # Go to cart
-    login_page.driver.find_element(By.CSS_SELECTOR, ".shopping_cart_link").click()
-    WebDriverWait(login_page.driver, 10).until(
-        EC.presence_of_element_located((By.ID, "cart_contents_container"))
-    )
+@pytest.mark.journey("inventory", "add:Sauce Labs Backpack", "cart", "checkout-info")
+@pytest.mark.parametrize("username", cart_users("cannot perform checkout"))
+def test_checkout_flow(journey, username):
+    login_page = journey.login
 
-    # Checkout
-    login_page.driver.find_element(By.ID, "checkout").click()
+    # The journey added the first product, opened the cart and started checkout
     WebDriverWait(login_page.driver, 10).until(
         EC.presence_of_element_located((By.ID, "checkout_info_container"))
     )
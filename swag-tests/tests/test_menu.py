@@ -1,9 +1,8 @@
 import pytest
 
-@pytest.mark.parametrize("username,password", [("standard_user", "secret_sauce")])
-def test_menu_and_logout(login_page, username, password, screenshot_dir):
-    login_page.load()
-    login_page.login(username, password)
+@pytest.mark.parametrize("username", ["standard_user"])
+def test_menu_and_logout(logged_in_as, username, screenshot_dir):
+    login_page = logged_in_as(username)
     assert login_page.wait_for_inventory(), "Inventory page not loaded"
 
     # Check menu button
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+from utils.visual_diff import VisualDiff
+
+
+def edge(column, width=40, height=20, ramp=()):
+    """White image, black left of `column`, with optional grey ramp pixels from `column` on"""
+    img = np.full((height, width, 3), 255, dtype=np.uint8)
+    img[:, :column] = 0
+    for i, level in enumerate(ramp):
+        img[:, column + i] = level
+    return img
+
+
+@pytest.mark.parametrize("baseline, current", [
+    (edge(20), edge(21)),
+    (edge(21), edge(20)),
+    (edge(20, ramp=[128]), edge(21, ramp=[128])),
+    (edge(20).transpose(1, 0, 2), edge(21).transpose(1, 0, 2)),
+], ids=["right", "left", "anti-aliased", "vertical"])
+def test_one_pixel_edge_shift_passes(baseline, current):
+    assert VisualDiff().compare(baseline, current)
+
+
+def test_two_pixel_edge_shift_fails():
+    result = VisualDiff().compare(edge(20), edge(22))
+    assert not result
+    assert result.diff_pixels == 2 * 20
+
+
+def test_colour_change_fails():
+    current = edge(20)
+    current[5:10, 25:30] = (255, 0, 0)
+    result = VisualDiff().compare(edge(20), current)
+    assert not result
+    assert result.bbox == (25, 5, 30, 10)
+
+
+def test_shift_fails_without_antialiasing():
+    assert not VisualDiff(antialiasing=False).compare(edge(20), edge(21))
@@ -0,0 +1,113 @@
+# utils/auth_state.py
+import json
+import os
+import re
+import time
+from urllib.parse import urljoin, urlsplit
+from pages.login_page import LoginPage
+from pages.inventory_page import InventoryPage
+from utils.perf import PERF
+
+CART_KEY = "cart-contents"
+
+RESTORE_STORAGE_JS = """
+window.localStorage.clear();
+for (const [k, v] of Object.entries(arguments[0])) window.localStorage.setItem(k, v);
+if (arguments[1]) {
+    window.sessionStorage.clear();
+    for (const [k, v] of Object.entries(arguments[1])) window.sessionStorage.setItem(k, v);
+}
+"""
+
+
+def inject_state(driver, base_url, cookies, local_storage, url, session_storage=None):
+    """Replace the browser's cookies and storage for the app, then open `url`"""
+    # Cookies and storage can only be set once we are on the app's origin
+    driver.get(base_url)
+    driver.delete_all_cookies()
+    for cookie in cookies:
+        cookie = {k: v for k, v in cookie.items() if k != "sameSite"}
+        driver.add_cookie(cookie)
+    driver.execute_script(RESTORE_STORAGE_JS, local_storage, session_storage)
+    driver.get(url)
+
+
+def origin(url):
+    """scheme://host:port of a URL, with the default port filled in"""
+    parts = urlsplit(url)
+    port = parts.port or {"http": 80, "https": 443}.get(parts.scheme)
+    return f"{parts.scheme}://{parts.hostname}:{port}"
+
+
+def origin_dir(url):
+    """origin() as a directory name, e.g. https_www.saucedemo.com_443"""
+    return re.sub(r"[^\w.-]+", "_", origin(url)).strip("_")
+
+
+class AuthStateCache:
+    """Logs each user in through the UI once per worker and replays the
+    captured cookies/localStorage for every later test.
+
+    States are kept per app origin, so cookies captured against one app
+    (e.g. --local-app) are never replayed against another.
+    """
+
+    def __init__(self, base_url, passwords, state_dir):
+        self.base_url = base_url
+        self.origin = origin(base_url)
+        self.passwords = passwords
+        self.state_dir = os.path.join(state_dir, origin_dir(base_url))
+        self._states = {}
+        os.makedirs(self.state_dir, exist_ok=True)
+
+    def _path(self, username):
+        return os.path.join(self.state_dir, f"{username}.json")
+
+    @staticmethod
+    def _is_fresh(state):
+        now = time.time()
+        return all(c.get("expiry", now + 1) > now for c in state["cookies"])
+
+    def _capture(self, driver, username):
+        """Real UI login, then snapshot cookies and localStorage"""
+        page = LoginPage(driver, base_url=self.base_url)
+        driver.delete_all_cookies()
+        page.load()
+        driver.execute_script("window.localStorage.clear();")
+        # Set-up for whichever test asked first, so it stays out of the timings
+        with PERF.muted(driver):
+            page.login(username, self.passwords[username])
+            page.wait_for_inventory(timeout=40)
+        return {
+            "username": username,
+            "origin": self.origin,
+            "captured_at": time.time(),
+            "cookies": driver.get_cookies(),
+            "local_storage": driver.execute_script(
+                "return Object.assign({}, window.localStorage);"
+            ),
+        }
+
+    def get(self, driver, username):
+        """Return the stored state for a user, logging in only when needed"""
+        state = self._states.get(username)
+        if state is None and os.path.exists(self._path(username)):
+            with open(self._path(username)) as f:
+                state = json.load(f)
+        if state is None or state.get("origin") != self.origin or not self._is_fresh(state):
+            state = self._capture(driver, username)
+            with open(self._path(username), "w") as f:
+                json.dump(state, f)
+        self._states[username] = state
+        return state
+
+    def apply(self, driver, username, cart=None, path=InventoryPage.PATH):
+        """Inject a user's state into the browser and open `path` directly"""
+        state = self.get(driver, username)
+        storage = dict(state["local_storage"])
+        if cart is not None:
+            storage[CART_KEY] = json.dumps([InventoryPage.PRODUCT_IDS[name] for name in cart])
+        else:
+            storage.pop(CART_KEY, None)
+
+        inject_state(driver, self.base_url, state["cookies"], storage, urljoin(self.base_url, path))
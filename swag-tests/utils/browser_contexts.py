@@ -0,0 +1,123 @@
+# utils/browser_contexts.py
+import copy
+import threading
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.switch_to import SwitchTo
+from selenium.webdriver.remote.webelement import WebElement
+from pages.checkout_page import CheckoutPage
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+
+# Longest an observed wait may hold the shared session before letting other contexts in
+WAIT_SLICE = 0.25
+
+
+class UserSession:
+    """Page objects for one user, all bound to that user's browser context"""
+
+    def __init__(self, driver, username, base_url=None):
+        self.driver = driver
+        self.username = username
+        self.login = LoginPage(driver, base_url=base_url)
+        self.inventory = InventoryPage(driver)
+        self.checkout = CheckoutPage(driver)
+        for page in (self.login, self.inventory, self.checkout):
+            page.username = username
+
+
+def _reparent(value, driver):
+    if isinstance(value, WebElement):
+        value._parent = driver
+    elif isinstance(value, list):
+        for item in value:
+            _reparent(item, driver)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _reparent(item, driver)
+
+
+class BrowserContexts:
+    """Isolated browser contexts (own cookies, storage and cache) inside one Chrome.
+
+    Each context is opened through CDP Target.createBrowserContext and gets a
+    tab of its own. open() returns a driver for that tab: it shares the
+    WebDriver session of the parent but switches to its own window before
+    every command, under a lock, so several threads can drive different users
+    at once. Commands are still serialized by chromedriver; the concurrency
+    comes from one user's waits and page loads overlapping another's commands.
+    The parent driver should only issue page commands again after close_all().
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._lock = threading.RLock()
+        self._home = self._current = driver.current_window_handle
+        self._contexts = {}
+
+    def open(self, url="about:blank"):
+        """Create a context with one tab at `url` and return a driver bound to it"""
+        with self._lock:
+            context_id = self.driver.execute_cdp_cmd("Target.createBrowserContext", {})["browserContextId"]
+            # chromedriver uses the DevTools target id as the window handle
+            handle = self.driver.execute_cdp_cmd(
+                "Target.createTarget", {"url": url, "browserContextId": context_id}
+            )["targetId"]
+        self._contexts[handle] = context_id
+        return self._bind(handle)
+
+    def session(self, username, base_url=None, url="about:blank"):
+        """Open a context and bind LoginPage/InventoryPage/CheckoutPage to it"""
+        return UserSession(self.open(url), username, base_url)
+
+    def _bind(self, handle):
+        # A shallow copy shares the session id and command executor
+        drv = copy.copy(self.driver)
+        for attr in ("execute", "quit"):
+            drv.__dict__.pop(attr, None)
+        drv._switch_to = SwitchTo(drv)
+        drv.context_handle = handle
+        drv.max_block_s = WAIT_SLICE
+
+        def execute(driver_command, params=None):
+            # Sent through the parent's execute(), so whatever wraps it (the pool's
+            # command counter, the command log) sees context traffic too
+            with self._lock:
+                if self._current != handle:
+                    self.driver.execute(Command.SWITCH_TO_WINDOW, {"handle": handle})
+                    self._current = handle
+                response = self.driver.execute(driver_command, params)
+            # Elements come back owned by the parent; hand them to the copy so their commands switch too
+            _reparent(response.get("value"), drv)
+            return response
+
+        drv.execute = execute
+        drv.quit = lambda: self.close(handle)
+        return drv
+
+    def close(self, handle):
+        """Dispose of the context whose tab is `handle` (a driver's context_handle)"""
+        context_id = self._contexts.pop(handle, None)
+        if context_id is None:
+            return
+        with self._lock:
+            self._restore()
+            self._dispose(context_id)
+
+    def close_all(self):
+        with self._lock:
+            self._restore()
+            for context_id in self._contexts.values():
+                self._dispose(context_id)
+            self._contexts.clear()
+
+    def _dispose(self, context_id):
+        try:
+            self.driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+        except Exception:
+            pass
+
+    def _restore(self):
+        # Back to the parent's own tab before its context-level commands
+        if self._current != self._home:
+            self.driver.switch_to.window(self._home)
+            self._current = self._home
@@ -0,0 +1,139 @@
+# utils/browser_pool.py
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+STORAGE_TYPES = "local_storage,session_storage,indexeddb,websql,cache_storage,service_workers"
+
+
+class PooledBrowser:
+    """A launched driver plus the bookkeeping used to decide when to recycle it"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.launched_at = time.time()
+        self.commands = 0
+        self.leases = 0
+        self._wrap_execute()
+
+    def _wrap_execute(self):
+        # Every WebDriver call funnels through execute(), so this counts all commands
+        original = self.driver.execute
+
+        def counted(driver_command, params=None):
+            self.commands += 1
+            return original(driver_command, params)
+
+        self.driver.execute = counted
+
+    def js_heap_mb(self):
+        """Renderer JS heap in MB via CDP, or None when CDP is unavailable"""
+        try:
+            self.driver.execute_cdp_cmd("Performance.enable", {})
+            metrics = self.driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+        except Exception:
+            return None
+        used = {m["name"]: m["value"] for m in metrics}.get("JSHeapUsedSize", 0)
+        return used / (1024 * 1024)
+
+
+class BrowserPool:
+    """Keeps `size` warm browsers per worker process and hands out a clean one per test.
+
+    Browsers are reset between tests (cookies, storage, extra tabs) instead of
+    relaunched, and are replaced in the background once they exceed the
+    command or memory thresholds.
+    """
+
+    def __init__(self, factory, size=1, origins=(), max_commands=5000, max_memory_mb=512):
+        self.factory = factory
+        self.size = max(1, size)
+        self.origins = [self._origin(url) for url in origins]
+        self.max_commands = max_commands
+        self.max_memory_mb = max_memory_mb
+        self.recycled = 0
+        self._idle = []
+        self._pending = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=self.size)
+        for _ in range(self.size):
+            self._launch_async()
+
+    @staticmethod
+    def _origin(url):
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def _launch_async(self):
+        future = self._executor.submit(lambda: PooledBrowser(self.factory()))
+        with self._lock:
+            self._pending.append(future)
+
+    def acquire(self):
+        """Return a ready driver, waiting for a warm-up launch if none is idle"""
+        browser = future = None
+        with self._lock:
+            if self._idle:
+                browser = self._idle.pop()
+            elif self._pending:
+                future = self._pending.pop(0)
+        if browser is None:
+            browser = future.result() if future else PooledBrowser(self.factory())
+        browser.leases += 1
+        return browser
+
+    def release(self, browser):
+        """Reset a browser for the next test, or recycle it if it is unhealthy"""
+        if self.needs_recycle(browser) or not self._reset(browser):
+            self._quit(browser)
+            self.recycled += 1
+            self._launch_async()
+            return
+        with self._lock:
+            self._idle.append(browser)
+
+    def needs_recycle(self, browser):
+        if browser.commands >= self.max_commands:
+            return True
+        heap = browser.js_heap_mb()
+        return heap is not None and heap >= self.max_memory_mb
+
+    def _reset(self, browser):
+        """Clear tabs, cookies and storage without relaunching; False if the browser is broken"""
+        drv = browser.driver
+        try:
+            handles = drv.window_handles
+            for handle in handles[1:]:
+                drv.switch_to.window(handle)
+                drv.close()
+            drv.switch_to.window(handles[0])
+            drv.get("about:blank")
+            drv.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            for origin in self.origins:
+                drv.execute_cdp_cmd(
+                    "Storage.clearDataForOrigin", {"origin": origin, "storageTypes": STORAGE_TYPES}
+                )
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(browser):
+        try:
+            browser.driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        with self._lock:
+            idle, pending = self._idle, self._pending
+            self._idle, self._pending = [], []
+        for future in pending:
+            try:
+                idle.append(future.result())
+            except Exception:
+                pass
+        for browser in idle:
+            self._quit(browser)
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,150 @@
+# utils/browser_startup.py
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+
+CHROME_BINARIES = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]
+CHROME_PATHS = [
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+]
+
+# Lean profile for functional (non-visual) tests
+FAST_ARGS = [
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-component-update",
+    "--disable-client-side-phishing-detection",
+    "--disable-features=Translate,OptimizationHints,MediaRouter,AutofillServerCommunication",
+    "--blink-settings=imagesEnabled=false",
+    "--metrics-recording-only",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--password-store=basic",
+    "--mute-audio",
+    "--hide-scrollbars",
+]
+FAST_PREFS = {"profile.managed_default_content_settings.images": 2}
+
+
+def chrome_version(binary=None):
+    """Installed Chrome version string (e.g. '124.0.6367.60'), or None if it can't be found"""
+    candidates = [binary] if binary else [shutil.which(b) for b in CHROME_BINARIES] + CHROME_PATHS
+    for path in candidates:
+        if not path or not os.path.exists(path):
+            continue
+        try:
+            out = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r"(\d+\.\d+\.\d+\.\d+)", out)
+        if match:
+            return match.group(1)
+    return None
+
+
+class DriverCache:
+    """Chromedriver paths keyed by Chrome version, so startup needs no network once resolved"""
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.index_path = os.path.join(cache_dir, "chromedriver.json")
+        self._lock = threading.Lock()
+        self._resolved = {}
+
+    def _load(self):
+        if not os.path.exists(self.index_path):
+            return {}
+        with open(self.index_path) as f:
+            return json.load(f)
+
+    def _save(self, index):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp, self.index_path)
+
+    def resolve(self, binary=None, install=None):
+        """Return a chromedriver path for the installed Chrome.
+
+        `install` is called only on a cache miss (e.g. ChromeDriverManager().install).
+        Returns None when nothing is cached and no installer is given, which lets
+        Selenium Manager pick the driver instead. When the Chrome version can't
+        be read, the driver is resolved without touching the on-disk cache, so a
+        stale chromedriver is never reused after a Chrome upgrade.
+        """
+        with self._lock:
+            # Already resolved in this process: skip even the `chrome --version` call
+            if binary in self._resolved:
+                return self._resolved[binary]
+            version = chrome_version(binary)
+            if version is None:
+                path = shutil.which("chromedriver") if install is None else install()
+                self._resolved[binary] = path
+                return path
+            # Chromedriver matches on major.minor.build
+            key = ".".join(version.split(".")[:3])
+            index = self._load()
+            path = index.get(key)
+            if not (path and os.path.exists(path)):
+                path = shutil.which("chromedriver") if install is None else install()
+                if path:
+                    index[key] = path
+                    self._save(index)
+            self._resolved[binary] = path
+            return path
+
+
+def apply_fast_profile(options, template_dir=None):
+    """Add the lean startup flags, and copy a pre-created user-data dir if one is given"""
+    for arg in FAST_ARGS:
+        options.add_argument(arg)
+    prefs = dict(options.experimental_options.get("prefs", {}))
+    prefs.update(FAST_PREFS)
+    options.add_experimental_option("prefs", prefs)
+    if template_dir:
+        profile_dir = tempfile.mkdtemp(prefix="swag-profile-")
+        shutil.copytree(template_dir, profile_dir, dirs_exist_ok=True)
+        options.add_argument(f"--user-data-dir={profile_dir}")
+        return profile_dir
+    return None
+
+
+class StartupStats:
+    """Driver resolution and browser launch times for this worker"""
+
+    def __init__(self):
+        self.launches = []
+        self._lock = threading.Lock()
+
+    def record(self, resolve_s, launch_s, fast):
+        with self._lock:
+            self.launches.append({"resolve_s": round(resolve_s, 3), "launch_s": round(launch_s, 3), "fast": fast})
+
+    def write(self, path, worker):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"worker": worker, "launches": self.launches}, f)
+
+
+STARTUP_STATS = StartupStats()
+
+
+def timed(fn):
+    """Run fn() and return (result, seconds)"""
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
@@ -0,0 +1,172 @@
+# utils/flight_recorder.py
+import json
+import os
+import time
+from collections import deque
+
+# Installed with Page.addScriptToEvaluateOnNewDocument. The page only keeps
+# metadata for its own load, clicks, changes, submits and uncaught errors, in
+# an in-memory ring on window: no layout reads, no storage writes, no console
+# wrapping. Nothing crosses the wire until a test fails.
+PAGE_RECORDER_JS = """
+(() => {
+    const LIMIT = %(limit)d;
+    const events = [];
+    Object.defineProperty(window, '__swagFlight', {value: events});
+    function describe(el) {
+        if (!el || !el.tagName) return null;
+        let out = el.tagName.toLowerCase();
+        if (el.id) out += '#' + el.id;
+        else if (el.classList.length) out += '.' + el.classList[0];
+        const test = el.getAttribute('data-test');
+        if (test) out += '[data-test=' + test + ']';
+        return out;
+    }
+    function record(reason, target, detail) {
+        events.push({time: Date.now() / 1000, reason, target: describe(target), detail, url: location.href});
+        if (events.length > LIMIT) events.shift();
+    }
+    for (const type of ['click', 'change', 'submit']) {
+        document.addEventListener(type, e => record(type, e.target), true);
+    }
+    addEventListener('load', () => record('load'));
+    addEventListener('error', e => record('uncaught', null, String(e.message).slice(0, 300)));
+    addEventListener('unhandledrejection', e => record('unhandledrejection', null, String(e.reason).slice(0, 300)));
+})();
+"""
+
+# Run once, from dump(): the events of the current document plus an outline of it
+COLLECT_JS = """
+function describe(el) {
+    let out = el.tagName.toLowerCase();
+    if (el.id) out += '#' + el.id;
+    else if (el.classList.length) out += '.' + el.classList[0];
+    const test = el.getAttribute('data-test');
+    if (test) out += '[data-test=' + test + ']';
+    if (el.tagName === 'INPUT') out += '=' + (el.type === 'password' && el.value ? '***' : JSON.stringify(el.value));
+    else {
+        const text = (el.innerText || '').trim().replace(/\\s+/g, ' ');
+        if (text) out += ' "' + text.slice(0, 40) + '"';
+    }
+    return out;
+}
+const elements = [];
+for (const el of document.querySelectorAll('button,a,input,select,h1,h2,h3,[data-test],.title,.shopping_cart_badge')) {
+    if (elements.length >= 60) break;
+    if (el.getClientRects().length) elements.push(describe(el));
+}
+return {
+    events: window.__swagFlight ? Array.from(window.__swagFlight) : [],
+    now: {time: Date.now() / 1000, reason: 'failure', url: location.href, title: document.title, elements},
+};
+"""
+
+
+def _summary(command, params):
+    """The one parameter worth keeping for a command, if any"""
+    params = params or {}
+    if "url" in params:
+        return params["url"]
+    if "using" in params:
+        return f"{params['using']}={params.get('value')}"
+    if "handle" in params:
+        return params["handle"]
+    return None
+
+
+def enable_console_log(options):
+    """Have chromedriver keep the console warnings and errors that dump() reads back"""
+    prefs = options.capabilities.get("goog:loggingPrefs", {})
+    options.set_capability("goog:loggingPrefs", dict(prefs, browser="WARNING"))
+
+
+class FlightRecorder:
+    """Ring buffer of the last `size` page-object actions for the current test.
+
+    Consecutive WebDriver commands issued by the same page-object method (or
+    test function) form one action. Recording costs a deque append per
+    command; the page-side events are only read back by dump().
+    """
+
+    def __init__(self, size=50):
+        self.size = size
+        self.actions = deque(maxlen=size)
+        self.url = None
+
+    @property
+    def enabled(self):
+        return self.size > 0
+
+    def resize(self, size):
+        self.size = size
+        self.actions = deque(maxlen=max(size, 1))
+
+    def reset(self):
+        self.actions.clear()
+        self.url = None
+
+    def on_command(self, method, command, params, seconds, ok):
+        if not self.enabled:
+            return
+        if command == "get" and params:
+            self.url = params.get("url")
+        last = self.actions[-1] if self.actions else None
+        if last is None or last["action"] != method:
+            last = {"time": round(time.time(), 3), "action": method, "url": self.url, "commands": [], "ms": 0.0, "ok": True}
+            self.actions.append(last)
+        detail = _summary(command, params)
+        # Keep the first few commands of an action verbatim; repeated polling only bumps the totals
+        if len(last["commands"]) < 8:
+            last["commands"].append(f"{command}({detail})" if detail else command)
+        last["ms"] = round(last["ms"] + seconds * 1000, 2)
+        last["ok"] = last["ok"] and ok
+
+    def install(self, driver, limit=20):
+        """Add the in-page event recorder to every document the driver's tab loads from now on"""
+        if not self.enabled:
+            return driver
+        source = PAGE_RECORDER_JS % {"limit": limit}
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source})
+        return driver
+
+    def drain_console(self, driver):
+        """Read and discard the browser console log, so dump() only sees the current test's output"""
+        if not self.enabled:
+            return
+        try:
+            driver.get_log("browser")
+        except Exception:
+            pass
+
+    def dump(self, driver, path, test_id, error=None):
+        """Write the actions merged with the page events, the console tail and a DOM outline; called on failure only"""
+        actions = list(self.actions)
+        page = {"events": [], "now": None}
+        console = []
+        if driver:
+            try:
+                page = driver.execute_script(COLLECT_JS) or page
+            except Exception as e:
+                page = dict(page, error=str(e))
+            try:
+                console = driver.get_log("browser")[-50:]
+            except Exception:
+                pass
+        timeline = [dict(a, kind="action") for a in actions]
+        timeline += [dict(e, kind="event") for e in page["events"]]
+        timeline.sort(key=lambda entry: entry["time"])
+        record = {
+            "test": test_id,
+            "error": error,
+            "timeline": timeline,
+            "console": console,
+            "final": page["now"],
+        }
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(record, f, indent=1)
+        return path
+
+
+# One test runs at a time per worker process
+FLIGHT = FlightRecorder()
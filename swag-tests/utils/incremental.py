@@ -0,0 +1,92 @@
+# utils/incremental.py
+# Incremental runs (--incremental): a test is skipped when it passed last time
+# against the same app build and the same test sources.
+import hashlib
+import json
+import os
+import re
+from urllib.parse import urljoin
+from urllib.request import urlopen
+
+# Pages the journeys touch; their HTML and every script they load make up the app fingerprint
+APP_PAGES = ["", "inventory.html", "cart.html", "checkout-step-one.html", "checkout-step-two.html",
+             "checkout-complete.html"]
+
+SCRIPT_SRC = re.compile(r"""<script[^>]*\bsrc=["']([^"']+)["']""", re.IGNORECASE)
+
+
+def _fetch(url, timeout):
+    with urlopen(url, timeout=timeout) as response:
+        return response.read()
+
+
+def app_fingerprint(base_url, pages=APP_PAGES, timeout=30):
+    """sha256 over the served HTML of `pages` and the JS bundles they reference"""
+    digest = hashlib.sha256()
+    seen = set()
+    for page in pages:
+        url = urljoin(base_url, page)
+        body = _fetch(url, timeout)
+        digest.update(url.encode() + b"\0" + body)
+        for src in SCRIPT_SRC.findall(body.decode("utf-8", "replace")):
+            script = urljoin(url, src)
+            if script not in seen:
+                seen.add(script)
+                digest.update(script.encode() + b"\0" + _fetch(script, timeout))
+    return digest.hexdigest()
+
+
+def files_fingerprint(paths, root):
+    """sha256 over the files under `paths` (files or directories), by path relative to `root` and content"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for folder, dirs, names in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+                files += [os.path.join(folder, name) for name in names if not name.endswith(".pyc")]
+        elif os.path.exists(path):
+            files.append(path)
+    digest = hashlib.sha256()
+    for path in sorted(files):
+        with open(path, "rb") as f:
+            digest.update(os.path.relpath(path, root).replace(os.sep, "/").encode() + b"\0" + f.read())
+    return digest.hexdigest()
+
+
+def combine(*parts):
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+class OutcomeCache:
+    """Last outcome of each test, with the fingerprint it ran against.
+
+    Every process reads the file at startup; only the main process records
+    outcomes and writes it back when the session ends.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.entries = json.load(f)
+
+    def unchanged_pass(self, nodeid, fingerprint):
+        """The run id in which the test last passed against `fingerprint`, if it did"""
+        entry = self.entries.get(nodeid)
+        if entry and entry["fingerprint"] == fingerprint and entry["outcome"] == "PASSED":
+            return entry["run_id"]
+        return None
+
+    def failed(self, nodeid):
+        entry = self.entries.get(nodeid)
+        return bool(entry) and entry["outcome"] == "FAILED"
+
+    def record(self, nodeid, fingerprint, outcome, run_id):
+        self.entries[nodeid] = {"fingerprint": fingerprint, "outcome": outcome, "run_id": run_id}
+
+    def save(self):
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
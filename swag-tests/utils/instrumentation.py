@@ -0,0 +1,113 @@
+# utils/instrumentation.py
+import json
+import sys
+import time
+from pages.base_page import BasePage
+from utils.flight_recorder import FLIGHT
+from utils.stats import percentile
+from utils.waits import WAIT_STATS
+
+MAX_STACK_DEPTH = 40
+
+
+def caller_name():
+    """Name the page-object method (or test function) that issued the current command"""
+    frame = sys._getframe(2)
+    test_name = None
+    for _ in range(MAX_STACK_DEPTH):
+        if frame is None:
+            break
+        owner = frame.f_locals.get("self")
+        if isinstance(owner, BasePage):
+            return f"{type(owner).__name__}.{frame.f_code.co_name}"
+        if test_name is None and frame.f_code.co_name.startswith("test_"):
+            test_name = frame.f_code.co_name
+        frame = frame.f_back
+    return test_name or "<harness>"
+
+
+class CommandLog:
+    """WebDriver commands and waits issued during the current test"""
+
+    def __init__(self):
+        self.entries = []
+        # Called as listener(method, command, params, seconds, ok) for every command
+        self.listeners = []
+
+    def reset(self):
+        self.entries = []
+
+    def add(self, method, command, seconds, ok):
+        self.entries.append([method, command, round(seconds * 1000, 2), ok])
+
+    def on_wait(self, description, seconds, timed_out):
+        self.add(caller_name(), "wait", seconds, not timed_out)
+
+
+# One test runs at a time per worker process
+COMMAND_LOG = CommandLog()
+WAIT_STATS.listeners.append(COMMAND_LOG.on_wait)
+COMMAND_LOG.listeners.append(FLIGHT.on_command)
+
+
+def instrument(driver, log=COMMAND_LOG):
+    """Record every command sent through driver.execute() into `log`"""
+    if getattr(driver, "_instrumented", False):
+        return driver
+    original = driver.execute
+
+    def timed(driver_command, params=None):
+        method = caller_name()
+        start = time.perf_counter()
+        try:
+            result = original(driver_command, params)
+        except Exception:
+            elapsed = time.perf_counter() - start
+            log.add(method, driver_command, elapsed, False)
+            for listener in log.listeners:
+                listener(method, driver_command, params, elapsed, False)
+            raise
+        elapsed = time.perf_counter() - start
+        log.add(method, driver_command, elapsed, True)
+        for listener in log.listeners:
+            listener(method, driver_command, params, elapsed, True)
+        return result
+
+    driver.execute = timed
+    driver._instrumented = True
+    return driver
+
+
+class LatencyHistogram:
+    """Aggregates command logs from many tests into per-method latency statistics"""
+
+    def __init__(self):
+        self.durations = {}
+        self.errors = {}
+
+    def add_entries(self, entries):
+        for method, command, ms, ok in entries:
+            # Waits span the commands they poll with, so they only get their own row
+            keys = [f"{method} [{command}]"] if command == "wait" else [method, f"{method} [{command}]"]
+            for key in keys:
+                self.durations.setdefault(key, []).append(ms)
+                self.errors[key] = self.errors.get(key, 0) + (not ok)
+
+    def summary(self):
+        rows = []
+        for key, values in self.durations.items():
+            values = sorted(values)
+            rows.append({
+                "name": key,
+                "count": len(values),
+                "errors": self.errors[key],
+                "total_ms": round(sum(values), 1),
+                "p50_ms": percentile(values, 50),
+                "p95_ms": percentile(values, 95),
+                "p99_ms": percentile(values, 99),
+            })
+        return sorted(rows, key=lambda r: -r["total_ms"])
+
+    def write_json(self, path):
+        with open(path, "w") as f:
+            json.dump(self.summary(), f, indent=2)
@@ -0,0 +1,115 @@
+# utils/journeys.py
+# Shared journey prefixes. Tests declare the state they start from, e.g.
+#
+#   @pytest.mark.journey("inventory", "add:Sauce Labs Backpack", "cart")
+#
+# Within a worker, each prefix is driven through the UI once per user; the
+# browser state at every branch point is snapshotted and later tests restore it
+# instead of replaying the steps that lead there.
+from collections import Counter
+from pages.inventory_page import InventoryPage
+from utils.auth_state import inject_state
+from utils.browser_contexts import UserSession
+
+ROOT = "inventory"
+ADD_PREFIX = "add:"
+
+# Step name -> action on a UserSession whose browser is in the previous step's state
+STEPS = {
+    "cart": lambda s: s.inventory.go_to_cart(),
+    "checkout-info": lambda s: s.checkout.start_checkout(),
+    "checkout-overview": lambda s: _to_overview(s),
+}
+
+SNAPSHOT_JS = """
+return {url: location.href, local: Object.assign({}, window.localStorage),
+        session: Object.assign({}, window.sessionStorage)};
+"""
+
+
+def _to_overview(session):
+    session.checkout.fill_info("Test", "User", "00100")
+    session.checkout.continue_checkout()
+    # The overview step has loaded once the finish button is there
+    session.checkout.wait.present(session.checkout.finish_btn, 5)
+
+
+def validate(steps):
+    """Return the steps as a tuple, or raise ValueError naming the bad one"""
+    steps = tuple(steps)
+    if not steps or steps[0] != ROOT:
+        raise ValueError(f"A journey starts at '{ROOT}', got {steps!r}")
+    for step in steps[1:]:
+        if step.startswith(ADD_PREFIX):
+            if step[len(ADD_PREFIX):] not in InventoryPage.PRODUCT_IDS:
+                raise ValueError(f"Unknown product in journey step '{step}'")
+        elif step not in STEPS:
+            raise ValueError(f"Unknown journey step '{step}' (choose from {', '.join(STEPS)} or add:<product>)")
+    return steps
+
+
+def run_step(session, step):
+    if step.startswith(ADD_PREFIX):
+        session.inventory.add_product_to_cart(step[len(ADD_PREFIX):])
+    else:
+        STEPS[step](session)
+
+
+class JourneyTree:
+    """Prefix tree of the collected tests' start states, one root per user.
+
+    Only counts are kept: a prefix needs a snapshot when more than one test
+    starts at or below it.
+    """
+
+    def __init__(self):
+        self.counts = Counter()
+
+    def add(self, username, steps):
+        for depth in range(1, len(steps) + 1):
+            self.counts[(username, steps[:depth])] += 1
+
+    def shared(self, username, prefix):
+        return self.counts[(username, tuple(prefix))] > 1
+
+
+class JourneyRunner:
+    """Brings a browser to a declared start state for a user, reusing snapshots of shared prefixes.
+
+    The root state comes from the AuthStateCache; each later step runs through
+    the page objects and, at branch points of the tree, the cookies, storage and
+    URL are captured so the next test below that point starts with one restore.
+    """
+
+    def __init__(self, base_url, auth_state, tree):
+        self.base_url = base_url
+        self.auth_state = auth_state
+        self.tree = tree
+        self._snapshots = {}
+
+    @staticmethod
+    def _snapshot(driver):
+        state = driver.execute_script(SNAPSHOT_JS)
+        state["cookies"] = driver.get_cookies()
+        return state
+
+    def _restore(self, driver, state):
+        inject_state(driver, self.base_url, state["cookies"], state["local"], state["url"], state["session"])
+
+    def reach(self, driver, username, steps):
+        """Drive `driver` to the end of `steps`; returns (session, steps replayed, steps restored)"""
+        steps = validate(steps)
+        depth = next((d for d in range(len(steps), 1, -1) if (username, steps[:d]) in self._snapshots), 1)
+        if depth > 1:
+            self._restore(driver, self._snapshots[(username, steps[:depth])])
+        else:
+            self.auth_state.apply(driver, username, path=InventoryPage.PATH)
+        session = UserSession(driver, username, self.base_url)
+        if depth == 1:
+            session.login.wait_for_inventory()
+        for d in range(depth, len(steps)):
+            run_step(session, steps[d])
+            prefix = steps[:d + 1]
+            if self.tree.shared(username, prefix):
+                self._snapshots[(username, prefix)] = self._snapshot(driver)
+        return session, len(steps) - depth, depth - 1
@@ -0,0 +1,115 @@
+# utils/layout_fingerprint.py
+import hashlib
+import json
+import os
+
+# Page name -> [selector, label]. A selector matching several elements gets
+# "for item N" appended to its label, counting from 1 in document order.
+LAYOUTS = {
+    "login": [
+        [".login_logo", "Logo"],
+        ["#user-name", "Username field"],
+        ["#password", "Password field"],
+        ["#login-button", "Login button"],
+    ],
+    "inventory": [
+        [".app_logo", "Logo"],
+        ["#react-burger-menu-btn", "Menu button"],
+        [".shopping_cart_link", "Cart link"],
+        [".title", "Title"],
+        [".product_sort_container", "Sort dropdown"],
+        [".inventory_item", "Card"],
+        [".inventory_item img", "Image"],
+        [".inventory_item_name", "Name"],
+        [".inventory_item_price", "Price"],
+        [".inventory_item button", "Add to cart button"],
+    ],
+}
+
+STYLES = ["display", "visibility", "opacity", "color", "background-color", "font-family", "font-size",
+          "font-weight", "text-align", "border-top-width"]
+
+# Everything comes back from a single execute_script; no screenshot is taken
+LAYOUT_JS = """
+const [spec, styles] = arguments;
+const out = {};
+for (const [selector, label] of spec) {
+    const els = document.querySelectorAll(selector);
+    els.forEach((el, i) => {
+        const r = el.getBoundingClientRect();
+        const cs = getComputedStyle(el);
+        const entry = {
+            box: [Math.round(r.x + scrollX), Math.round(r.y + scrollY), Math.round(r.width), Math.round(r.height)],
+            style: Object.fromEntries(styles.map(name => [name, cs.getPropertyValue(name)])),
+            text: (el.innerText || el.value || '').trim().replace(/\\s+/g, ' ').slice(0, 80),
+        };
+        if (el.tagName === 'IMG') entry.src = el.getAttribute('src');
+        out[els.length > 1 ? `${label} for item ${i + 1}` : label] = entry;
+    });
+}
+return out;
+"""
+
+
+def capture(driver, page):
+    """Boxes, computed styles, text and image sources of the page's key elements, plus their digest"""
+    elements = driver.execute_script(LAYOUT_JS, LAYOUTS[page], STYLES)
+    return {"page": page, "digest": digest(elements), "elements": elements}
+
+
+def digest(elements):
+    canonical = json.dumps(elements, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def diff(baseline, current, tolerance_px=1):
+    """Element-level differences, e.g. 'Add to cart button for item 3 moved 12px (y +12)'"""
+    before, after = baseline["elements"], current["elements"]
+    changes = []
+    for key in before:
+        if key not in after:
+            changes.append(f"{key} missing")
+            continue
+        old, new = before[key], after[key]
+        dx, dy = new["box"][0] - old["box"][0], new["box"][1] - old["box"][1]
+        if max(abs(dx), abs(dy)) > tolerance_px:
+            axes = ", ".join(f"{axis} {delta:+d}" for axis, delta in (("x", dx), ("y", dy)) if delta)
+            changes.append(f"{key} moved {round((dx * dx + dy * dy) ** 0.5)}px ({axes})")
+        if any(abs(n - o) > tolerance_px for n, o in zip(new["box"][2:], old["box"][2:])):
+            changes.append(f"{key} resized {old['box'][2]}x{old['box'][3]} -> {new['box'][2]}x{new['box'][3]}")
+        for name in sorted(set(old["style"]) | set(new["style"])):
+            if old["style"].get(name) != new["style"].get(name):
+                changes.append(f"{key} {name} {old['style'].get(name)} -> {new['style'].get(name)}")
+        if old["text"] != new["text"]:
+            changes.append(f"{key} text {old['text']!r} -> {new['text']!r}")
+        if old.get("src") != new.get("src"):
+            changes.append(f"{key} src {old.get('src')} -> {new.get('src')}")
+    changes += [f"{key} added" for key in after if key not in before]
+    return changes
+
+
+class LayoutBaselines:
+    """Stored fingerprints, one JSON file per user and page, each with the PNG recorded alongside it"""
+
+    def __init__(self, root):
+        self.root = root
+
+    def path(self, username, page):
+        return os.path.join(self.root, f"{username}_{page}.json")
+
+    def png_path(self, username, page):
+        return os.path.join(self.root, f"{username}_{page}.png")
+
+    def load(self, username, page):
+        path = self.path(username, page)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    def save(self, username, page, layout, png):
+        os.makedirs(self.root, exist_ok=True)
+        with open(self.png_path(username, page), "wb") as f:
+            f.write(png)
+        with open(self.path(username, page), "w") as f:
+            json.dump(layout, f, indent=1, sort_keys=True)
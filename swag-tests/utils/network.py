@@ -0,0 +1,182 @@
+# utils/network.py
+import datetime
+import json
+import os
+import threading
+from utils.reporting import artifact_path
+
+# URL patterns for Network.setBlockedURLs ('*' is the only wildcard)
+BLOCK_PATTERNS = {
+    "images": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico"],
+    "fonts": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*fonts.googleapis.com*", "*fonts.gstatic.com*"],
+    "analytics": [
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*backtrace.io*", "*optimizely.com*", "*segment.io*", "*hotjar.com*",
+    ],
+}
+
+# Policy name -> blocked resource groups. Visual tests always get "full".
+POLICIES = {
+    "full": (),
+    "lean": ("images", "fonts", "analytics"),
+}
+
+HAR_MODES = ["off", "failed", "all"]
+
+
+def blocked_patterns(policy):
+    return [pattern for group in POLICIES[policy] for pattern in BLOCK_PATTERNS[group]]
+
+
+def apply_policy(driver, policy):
+    """Block the policy's resource groups in the driver's current tab (an empty list unblocks)"""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_patterns(policy)})
+
+
+def enable_har_logging(options):
+    """Turn on chromedriver's performance log, which carries the Network.* events HARs are built from"""
+    prefs = options.capabilities.get("goog:loggingPrefs", {})
+    options.set_capability("goog:loggingPrefs", dict(prefs, performance="ALL"))
+    options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
+
+class AssetCacheDirs:
+    """Persistent --disk-cache-dir slots, so relaunched browsers start with static assets cached.
+
+    Chrome must not share a cache dir between running instances, so each
+    browser takes a free slot and gives it back when it quits.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self._in_use = set()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            slot = 0
+            while slot in self._in_use:
+                slot += 1
+            self._in_use.add(slot)
+        path = os.path.join(self.root, f"slot-{slot}")
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def release(self, path):
+        with self._lock:
+            self._in_use.discard(int(path.rsplit("-", 1)[1]))
+
+
+def drain_events(driver):
+    """Read and discard the performance log, e.g. before a test starts"""
+    driver.get_log("performance")
+
+
+def network_events(driver):
+    """Network.* CDP events logged since the last read"""
+    events = []
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        if message["method"].startswith("Network."):
+            events.append(message)
+    return events
+
+
+def _headers(headers):
+    return [{"name": k, "value": str(v)} for k, v in (headers or {}).items()]
+
+
+def _header(headers, name):
+    return next((str(v) for k, v in (headers or {}).items() if k.lower() == name), "")
+
+
+def _ms(start, end):
+    # CDP timestamps are monotonic seconds
+    return round((end - start) * 1000, 3) if end is not None else -1
+
+
+def build_har(events, title="", creator="swag-tests"):
+    """HAR 1.2 log from Network.* events; one entry per request, blocked and failed ones included"""
+    requests = {}
+    hops = 0
+    for event in events:
+        params = event["params"]
+        request_id = params.get("requestId")
+        method = event["method"]
+        if method == "Network.requestWillBeSent":
+            if request_id in requests and "redirectResponse" in params:
+                # A redirect reuses the request id; close the previous hop as its own entry
+                hop = requests.pop(request_id)
+                hop["response"] = {"response": params["redirectResponse"]}
+                hop["finished"] = {"timestamp": params["timestamp"]}
+                hops += 1
+                requests[f"{request_id}:{hops}"] = hop
+            requests[request_id] = {"sent": params}
+        elif request_id in requests:
+            key = {
+                "Network.responseReceived": "response",
+                "Network.loadingFinished": "finished",
+                "Network.loadingFailed": "failed",
+            }.get(method)
+            if key:
+                requests[request_id][key] = params
+
+    entries = []
+    for record in sorted(requests.values(), key=lambda r: r["sent"]["timestamp"]):
+        sent = record["sent"]
+        request = sent["request"]
+        response = record.get("response", {}).get("response", {})
+        done = record.get("finished") or record.get("failed") or {}
+        failed = record.get("failed", {})
+        size = record.get("finished", {}).get("encodedDataLength", -1)
+        elapsed = max(_ms(sent["timestamp"], done.get("timestamp")), 0)
+        entries.append({
+            "startedDateTime": datetime.datetime.fromtimestamp(
+                sent["wallTime"], datetime.timezone.utc).isoformat(),
+            "time": elapsed,
+            "_resourceType": sent.get("type"),
+            "_error": failed.get("blockedReason") or failed.get("errorText"),
+            "request": {
+                "method": request["method"],
+                "url": request["url"],
+                "httpVersion": response.get("protocol", ""),
+                "headers": _headers(request.get("headers")),
+                "queryString": [],
+                "cookies": [],
+                "headersSize": -1,
+                "bodySize": -1,
+            },
+            "response": {
+                "status": response.get("status", 0),
+                "statusText": response.get("statusText", ""),
+                "httpVersion": response.get("protocol", ""),
+                "headers": _headers(response.get("headers")),
+                "cookies": [],
+                "content": {"size": size, "mimeType": response.get("mimeType", "")},
+                "redirectURL": _header(response.get("headers"), "location"),
+                "headersSize": -1,
+                "bodySize": size,
+                "_fromDiskCache": response.get("fromDiskCache", False),
+            },
+            "cache": {},
+            "timings": {"send": 0, "wait": elapsed, "receive": 0},
+        })
+    return {"log": {
+        "version": "1.2",
+        "creator": {"name": creator, "version": "1"},
+        "pages": [],
+        "entries": entries,
+        "comment": title,
+    }}
+
+
+def har_path(root, run_id, nodeid):
+    return artifact_path(root, run_id, nodeid, ".har")
+
+
+def write_har(path, events, title=""):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(build_har(events, title), f)
+    return path
@@ -0,0 +1,193 @@
+# utils/perf.py
+import json
+import os
+import time
+from contextlib import contextmanager
+from utils.stats import percentile
+
+MARK = "swag:transition-start"
+
+MARK_JS = f"performance.clearMarks('{MARK}'); performance.mark('{MARK}');"
+
+# Navigation/paint timings of the current document plus the time since the last transition mark
+COLLECT_JS = f"""
+const nav = performance.getEntriesByType('navigation')[0];
+const paint = Object.fromEntries(performance.getEntriesByType('paint').map(e => [e.name, e.startTime]));
+const mark = performance.getEntriesByName('{MARK}').pop();
+const out = {{url: location.href, resources: performance.getEntriesByType('resource').length}};
+if (nav) {{
+    out.ttfb = nav.responseStart;
+    out.dom_interactive = nav.domInteractive;
+    out.dom_content_loaded = nav.domContentLoadedEventEnd;
+    out.load = nav.loadEventEnd || null;
+}}
+if (paint['first-contentful-paint'] !== undefined) out.fcp = paint['first-contentful-paint'];
+// A full navigation wipes the mark; in that case the document timings above are the transition
+out.transition = mark ? performance.now() - mark.startTime : (nav ? nav.domInteractive : null);
+return out;
+"""
+
+METRICS = ["transition", "ttfb", "dom_interactive", "dom_content_loaded", "load", "fcp"]
+
+
+class PerfStore:
+    """Timing samples (one JSON line each) and the per page/user/metric p95 baseline"""
+
+    def __init__(self, root):
+        self.root = root
+        self.samples_path = os.path.join(root, "samples.jsonl")
+        self.baseline_path = os.path.join(root, "baseline.json")
+        os.makedirs(root, exist_ok=True)
+
+    def append(self, sample):
+        with open(self.samples_path, "a") as f:
+            f.write(json.dumps(sample) + "\n")
+
+    def samples(self):
+        if not os.path.exists(self.samples_path):
+            return []
+        with open(self.samples_path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def history(self, page, user, metric, runs=20, samples=None):
+        """Values of a metric from the most recent `runs` runs, oldest first"""
+        matching = [
+            s for s in (self.samples() if samples is None else samples)
+            if s["page"] == page and s["user"] == user and s["metrics"].get(metric) is not None
+        ]
+        recent_runs = []
+        for s in reversed(matching):
+            if s["run"] not in recent_runs:
+                recent_runs.append(s["run"])
+        keep = set(recent_runs[:runs])
+        return [s["metrics"][metric] for s in matching if s["run"] in keep]
+
+    def baseline(self):
+        if not os.path.exists(self.baseline_path):
+            return {}
+        with open(self.baseline_path) as f:
+            return json.load(f)
+
+    def save_baseline(self, runs=20):
+        samples = self.samples()
+        keys = {(s["page"], s["user"]) for s in samples}
+        baseline = {}
+        for page, user in sorted(keys):
+            for metric in METRICS:
+                values = sorted(self.history(page, user, metric, runs, samples))
+                if values:
+                    baseline[f"{page}|{user}|{metric}"] = percentile(values, 95)
+        with open(self.baseline_path, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        return baseline
+
+
+class BudgetResult:
+    def __init__(self, page, user, metric, p95, samples, budget=None, baseline=None):
+        self.page = page
+        self.user = user
+        self.metric = metric
+        self.p95 = p95
+        self.samples = samples
+        self.budget = budget
+        self.baseline = baseline
+
+    @property
+    def delta(self):
+        return None if self.baseline is None else self.p95 - self.baseline
+
+    @property
+    def passed(self):
+        return self.budget is None or self.p95 <= self.budget
+
+    def __str__(self):
+        text = f"{self.page}/{self.user} {self.metric} p95={self.p95:.0f}ms over {self.samples} samples"
+        if self.baseline is not None:
+            text += f" ({self.delta:+.0f}ms vs baseline {self.baseline:.0f}ms)"
+        if self.budget is not None:
+            text += f", budget {self.budget:.0f}ms"
+        return text
+
+
+class PerfRecorder:
+    """Collects browser timings after page transitions when --perf is enabled"""
+
+    def __init__(self):
+        self.enabled = False
+        self.store = None
+        self.run_id = None
+        self.user = "unknown_user"
+        self.test = None
+        self.history_runs = 20
+        # ids of drivers with a mark() not yet consumed by capture(), and of drivers not recorded at all
+        self._marked = set()
+        self._muted = set()
+
+    def configure(self, store, run_id, history_runs=20):
+        self.enabled = True
+        self.store = store
+        self.run_id = run_id
+        self.history_runs = history_runs
+
+    def reset(self):
+        """Forget marks left over from the previous test (pooled browsers outlive it)"""
+        self._marked.clear()
+
+    @contextmanager
+    def muted(self, driver):
+        """Record nothing for `driver` inside the block, e.g. a set-up login that is not under test"""
+        self._muted.add(id(driver))
+        try:
+            yield
+        finally:
+            self._muted.discard(id(driver))
+
+    def mark(self, driver):
+        """Call right before the action that starts a transition"""
+        if self.enabled and id(driver) not in self._muted:
+            driver.execute_script(MARK_JS)
+            self._marked.add(id(driver))
+
+    def capture(self, driver, page, user=None):
+        """Record the page's timings; without a preceding mark() they go under '<page>:load'"""
+        if not self.enabled or id(driver) in self._muted:
+            return None
+        metrics = driver.execute_script(COLLECT_JS)
+        if id(driver) in self._marked:
+            self._marked.discard(id(driver))
+        else:
+            # Opened directly (auth-state replay, journey restore): there is no transition to time
+            metrics.pop("transition", None)
+            page = f"{page}:load"
+        sample = {
+            "run": self.run_id, "time": time.time(), "test": self.test,
+            "user": user or self.user, "page": page, "metrics": metrics,
+        }
+        self.store.append(sample)
+        return sample
+
+    def evaluate(self, page, metric="transition", p95_ms=None, user=None, samples=None, baseline=None):
+        """p95 of a metric over recent runs (including this one) against a budget and the baseline"""
+        user = user or self.user
+        values = sorted(self.store.history(page, user, metric, self.history_runs, samples))
+        if not values:
+            return None
+        baseline = (self.store.baseline() if baseline is None else baseline).get(f"{page}|{user}|{metric}")
+        return BudgetResult(page, user, metric, percentile(values, 95), len(values), p95_ms, baseline)
+
+    def run_report(self):
+        """Every page/user/metric seen in this run, compared with the baseline"""
+        samples = self.store.samples()
+        baseline = self.store.baseline()
+        seen = sorted({(s["page"], s["user"]) for s in samples if s["run"] == self.run_id})
+        results = []
+        for page, user in seen:
+            for metric in METRICS:
+                result = self.evaluate(page, metric, user=user, samples=samples, baseline=baseline)
+                if result:
+                    results.append(result)
+        return results
+
+
+# One test runs at a time per worker process
+PERF = PerfRecorder()
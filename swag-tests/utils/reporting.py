@@ -0,0 +1,136 @@
+# utils/reporting.py
+import html
+import json
+import os
+import re
+
+OUTCOMES = ["PASSED", "FAILED", "XFAILED", "SKIPPED", "BLOCKED", "CACHED"]
+MAX_MESSAGE = 2000
+
+# Bulky per-test properties that are aggregated elsewhere instead of streamed
+UNSTREAMED_PROPERTIES = {"commands"}
+
+
+def classify(phases, blocked, cached=False):
+    """Collapse setup/call/teardown reports into one outcome.
+
+    Only an expected failure that did fail (reported as skipped) is XFAILED;
+    a non-strict XPASS is reported as passed and counts as PASSED.
+    """
+    if blocked:
+        return "BLOCKED"
+    if cached:
+        return "CACHED"
+    if any(p["outcome"] == "skipped" and p["wasxfail"] for p in phases.values()):
+        return "XFAILED"
+    if any(p["outcome"] == "failed" for p in phases.values()):
+        return "FAILED"
+    if any(p["outcome"] == "skipped" for p in phases.values()):
+        return "SKIPPED"
+    return "PASSED"
+
+
+class ResultStream:
+    """Appends one JSON line per finished test while the run is in progress.
+
+    Only the main process writes (under xdist it receives every worker's
+    reports), so the file never has concurrent writers. Memory holds just
+    the tests whose teardown has not been reported yet.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.tally = dict.fromkeys(OUTCOMES, 0)
+        self._pending = {}
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._file = open(path, "a")
+
+    def record(self, rep):
+        """Add one phase report; returns the test's outcome once its teardown is in"""
+        phases = self._pending.setdefault(rep.nodeid, {})
+        phases[rep.when] = {
+            "outcome": rep.outcome,
+            "duration": rep.duration,
+            "wasxfail": hasattr(rep, "wasxfail"),
+            "message": rep.longreprtext[:MAX_MESSAGE] if rep.failed or rep.skipped else "",
+            "user_properties": [list(p) for p in rep.user_properties],
+        }
+        if rep.when == "teardown":
+            return self._finish(rep, self._pending.pop(rep.nodeid))
+        return None
+
+    def _finish(self, rep, phases):
+        outcome = classify(phases, "blocked" in rep.keywords, "cached" in rep.keywords)
+        self.tally[outcome] += 1
+        properties = {}
+        for phase in phases.values():
+            properties.update({k: v for k, v in phase["user_properties"] if k not in UNSTREAMED_PROPERTIES})
+        entry = {
+            "nodeid": rep.nodeid,
+            "outcome": outcome,
+            "duration": round(sum(p["duration"] for p in phases.values()), 3),
+            "message": next((p["message"] for p in phases.values() if p["message"]), ""),
+            "properties": properties,
+        }
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+        return outcome
+
+    def close(self):
+        self._file.close()
+
+
+def artifact_path(root, run_id, nodeid, suffix):
+    """Per-test file under root/<run id>/, named after the node id"""
+    name = re.sub(r"[^\w.-]+", "_", nodeid).strip("_")
+    return os.path.join(root, run_id, name + suffix)
+
+
+def iter_results(stream_path):
+    with open(stream_path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def render_html(stream_path, html_path, tally, screenshot_href=None, sections=()):
+    """Write the HTML summary row by row from the JSON-lines stream.
+
+    `sections` are extra tables appended after the results, as (title, rows)
+    where rows is a list of dicts sharing the same keys.
+    """
+    with open(html_path, "w") as out:
+        out.write("<!DOCTYPE html><html><head><meta charset='utf-8'><title>Test Report</title>"
+                  "<style>body{font-family:sans-serif}td,th{padding:4px 8px;text-align:left;vertical-align:top}"
+                  ".PASSED{color:#2a2}.FAILED{color:#c22}.XFAILED,.SKIPPED{color:#a80}.BLOCKED{color:#888}.CACHED{color:#27a}"
+                  "pre{white-space:pre-wrap;max-width:900px}</style></head><body>\n")
+        out.write("<h1>Test Report</h1><p>")
+        out.write(" &middot; ".join(f"<span class='{o}'>{o}: {tally[o]}</span>" for o in OUTCOMES))
+        out.write("</p>\n<table><tr><th>Test</th><th>Outcome</th><th>Duration (s)</th><th>Details</th></tr>\n")
+        for entry in iter_results(stream_path):
+            details = ""
+            if entry["message"]:
+                details += f"<pre>{html.escape(entry['message'])}</pre>"
+            digest = entry["properties"].get("screenshot")
+            if digest and screenshot_href:
+                href = html.escape(screenshot_href(digest))
+                details += f"<a href='{href}'><img src='{href}' width='320' loading='lazy'></a>"
+            for key, label in (("flight", "Flight recorder"), ("har", "HAR")):
+                href = entry["properties"].get(key)
+                if href:
+                    details += f" <a href='{html.escape(href)}'>{label}</a>"
+            out.write(
+                f"<tr><td>{html.escape(entry['nodeid'])}</td><td class='{entry['outcome']}'>{entry['outcome']}</td>"
+                f"<td>{entry['duration']:.2f}</td><td>{details}</td></tr>\n"
+            )
+        out.write("</table>\n")
+        for title, rows in sections:
+            if not rows:
+                continue
+            out.write(f"<h2>{html.escape(title)}</h2><table><tr>")
+            out.write("".join(f"<th>{html.escape(str(k))}</th>" for k in rows[0]))
+            out.write("</tr>\n")
+            for row in rows:
+                out.write("<tr>" + "".join(f"<td>{html.escape(str(v))}</td>" for v in row.values()) + "</tr>\n")
+            out.write("</table>\n")
+        out.write("</body></html>\n")
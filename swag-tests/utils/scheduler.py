@@ -0,0 +1,35 @@
+# utils/scheduler.py
+# Longest-processing-time-first scheduling for pytest-xdist, enabled with --schedule-by-duration.
+from collections import OrderedDict
+from xdist.scheduler import LoadScopeScheduling
+from utils.timings import plan_scopes
+
+
+class LongestFirstQueue(OrderedDict):
+    """Work queue whose popitem(last=False) hands out the heaviest remaining unit"""
+
+    def __init__(self, estimate):
+        super().__init__()
+        self.estimate = estimate
+
+    def popitem(self, last=True):
+        if last:
+            return super().popitem(last=True)
+        scope = max(self, key=lambda s: sum(self.estimate(n) for n in self[s]))
+        return scope, self.pop(scope)
+
+
+class DurationScheduling(LoadScopeScheduling):
+    """LoadScopeScheduling with user-grouped scopes dispatched longest-first"""
+
+    def __init__(self, config, log=None, timings=None, users=()):
+        super().__init__(config, log)
+        self.timings = timings
+        self.users = users
+        self.workqueue = LongestFirstQueue(timings.estimate)
+        self._scopes = None
+
+    def _split_scope(self, nodeid):
+        if self._scopes is None:
+            self._scopes = plan_scopes(self.collection, self.timings.estimate, len(self.nodes), self.users)
+        return self._scopes.get(nodeid, nodeid)
@@ -0,0 +1,102 @@
+# utils/screenshot_store.py
+import base64
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+
+
+class ScreenshotStore:
+    """Content-addressed screenshot storage with a background writer.
+
+    Images live under objects/<2-char prefix>/<sha256>.png, so a byte-identical
+    screenshot is stored once no matter how many tests or runs produce it.
+    index.jsonl maps run/test/user to the image hash. The writer thread is
+    started by the first submit(), so importing or creating a store is free.
+    """
+
+    def __init__(self, root, run_id):
+        self.root = root
+        self.run_id = run_id
+        self.objects_dir = os.path.join(root, "objects")
+        self.index_path = os.path.join(root, "index.jsonl")
+        self._queue = queue.Queue()
+        self._writer = None
+        self._lock = threading.Lock()
+
+    def path_for(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], f"{digest}.png")
+
+    def _start_writer(self):
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._drain, name="screenshot-writer", daemon=True)
+                self._writer.start()
+
+    def submit(self, png, test_id, user="unknown_user"):
+        """Queue a screenshot (PNG bytes or base64 string); returns (hash, final path).
+
+        Decoding and hashing happen here, as the caller needs the hash; the
+        file and index writes happen on the writer thread.
+        """
+        self._start_writer()
+        if isinstance(png, str):
+            png = base64.b64decode(png)
+        digest = hashlib.sha256(png).hexdigest()
+        entry = {"run": self.run_id, "test": test_id, "user": user, "hash": digest, "time": time.time()}
+        self._queue.put((digest, png, entry))
+        return digest, self.path_for(digest)
+
+    def capture(self, driver, test_id, user="unknown_user"):
+        """Grab the screenshot from the driver and hand the write off to the background thread"""
+        return self.submit(driver.get_screenshot_as_base64(), test_id, user)
+
+    def _drain(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                self._write(*job)
+            except Exception as e:
+                print(f"\n[ERROR] Could not store screenshot: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, digest, png, entry):
+        path = self.path_for(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temp name first so a concurrent worker never sees a partial file
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(png)
+            os.replace(tmp, path)
+        with open(self.index_path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    def flush(self):
+        self._queue.join()
+
+    def close(self):
+        if self._writer is None:
+            return
+        self.flush()
+        self._queue.put(None)
+        self._writer.join()
+        self._writer = None
+
+    def lookup(self, test_id=None, user=None, run=None):
+        """Index entries matching the given filters, oldest first"""
+        if not os.path.exists(self.index_path):
+            return []
+        with open(self.index_path) as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+        return [
+            e for e in entries
+            if (test_id is None or e["test"] == test_id)
+            and (user is None or e["user"] == user)
+            and (run is None or e["run"] == run)
+        ]
@@ -0,0 +1,75 @@
+# utils/timings.py
+import json
+import os
+import re
+from utils.stats import percentile
+
+PARAMS = re.compile(r"\[(.*)\]$")
+
+
+class TimingStore:
+    """Per-test durations smoothed across runs (exponential moving average)"""
+
+    def __init__(self, path, alpha=0.5):
+        self.path = path
+        self.alpha = alpha
+        self.durations = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                self.durations = json.load(f)
+
+    def estimate(self, nodeid):
+        """Known duration, or the median of known tests for a new one"""
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        known = sorted(self.durations.values())
+        return percentile(known, 50) if known else 1.0
+
+    def update(self, measured):
+        for nodeid, seconds in measured.items():
+            previous = self.durations.get(nodeid)
+            self.durations[nodeid] = seconds if previous is None else (
+                self.alpha * seconds + (1 - self.alpha) * previous
+            )
+
+    def save(self):
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.durations, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
+
+
+def user_of(nodeid, users):
+    """The USERS account a parametrized test runs as, taken from its id"""
+    match = PARAMS.search(nodeid)
+    if not match:
+        return None
+    for part in match.group(1).split("-"):
+        if part in users:
+            return part
+    return None
+
+
+def plan_scopes(nodeids, estimate, workers, users):
+    """Assign each test a scheduling scope.
+
+    Tests for the same user share a scope (and so a worker, reusing its
+    cached login state), but a user whose tests add up to more than an even
+    share of the run is split into chunks so one user can't pin one worker.
+    Tests without a user get their own scope.
+    """
+    total = sum(estimate(n) for n in nodeids)
+    share = total / max(workers, 1)
+    scopes = {}
+    chunk_load = {}
+    for nodeid in sorted(nodeids, key=lambda n: -estimate(n)):
+        user = user_of(nodeid, users)
+        if user is None:
+            scopes[nodeid] = nodeid
+            continue
+        chunk = 0
+        while chunk_load.get((user, chunk), 0) and chunk_load[(user, chunk)] + estimate(nodeid) > share:
+            chunk += 1
+        chunk_load[(user, chunk)] = chunk_load.get((user, chunk), 0) + estimate(nodeid)
+        scopes[nodeid] = f"{user}#{chunk}"
+    return scopes
@@ -0,0 +1,43 @@
+# utils/transport.py
+import socket
+from urllib3.connection import HTTPConnection
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.remote.client_config import ClientConfig
+
+TRANSPORTS = ["pooled", "selenium"]
+
+# urllib3 already sets TCP_NODELAY; keep idle pooled sockets alive through NATs and grid load balancers
+SOCKET_OPTIONS = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+
+def pooled_connection(server_url, pool_size=4, timeout=120):
+    """Keep-alive connection to chromedriver or a grid with up to `pool_size` reusable sockets.
+
+    Threads driving the same session (browser contexts, the load runner)
+    share the sockets; when all are busy they wait for one instead of
+    opening a throwaway connection. The URL is used as given, so the host
+    name still reaches DNS, TLS and the grid's routing; the pool is what
+    saves the per-command connect.
+    """
+    config = ClientConfig(
+        remote_server_addr=server_url,
+        keep_alive=True,
+        timeout=timeout,
+        init_args_for_pool_manager={"init_args_for_pool_manager": {
+            "maxsize": pool_size,
+            "block": True,
+            "socket_options": SOCKET_OPTIONS,
+        }},
+    )
+    return ChromiumRemoteConnection(
+        remote_server_addr=config.remote_server_addr, vendor_prefix="goog", browser_name="chrome",
+        client_config=config,
+    )
+
+
+def use_pooled_transport(driver, pool_size=4, timeout=120):
+    """Move a locally launched Chrome driver onto the pooled connection (the session is kept)"""
+    launch_connection = driver.command_executor
+    driver.command_executor = pooled_connection(driver.service.service_url, pool_size, timeout)
+    launch_connection.close()
+    return driver
@@ -0,0 +1,165 @@
+# utils/visual_diff.py
+import os
+from io import BytesIO
+import numpy as np
+from PIL import Image
+
+# Offsets of the 8 neighbours checked for anti-aliasing
+NEIGHBOURS = [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if (dy, dx) != (0, 0)]
+
+
+class DiffResult:
+    """Outcome of a visual comparison"""
+
+    def __init__(self, passed, diff_pixels=0, total_pixels=0, bbox=None, reason=None, diff_path=None):
+        self.passed = passed
+        self.diff_pixels = diff_pixels
+        self.total_pixels = total_pixels
+        self.bbox = bbox
+        self.reason = reason
+        self.diff_path = diff_path
+
+    @property
+    def diff_ratio(self):
+        return self.diff_pixels / self.total_pixels if self.total_pixels else 0.0
+
+    @property
+    def diff_percent(self):
+        return self.diff_ratio * 100
+
+    def __bool__(self):
+        return self.passed
+
+    def __repr__(self):
+        status = "passed" if self.passed else "failed"
+        detail = self.reason or f"{self.diff_pixels} px ({self.diff_percent:.3f}%)"
+        return f"<DiffResult {status}: {detail}>"
+
+
+def load_image(source):
+    """Load a path, PNG bytes or PIL image as an RGB uint8 array"""
+    if isinstance(source, np.ndarray):
+        return source[..., :3]
+    if isinstance(source, (bytes, bytearray)):
+        source = BytesIO(source)
+    if not isinstance(source, Image.Image):
+        source = Image.open(source)
+    return np.asarray(source.convert("RGB"))
+
+
+# Baselines are decoded once per process and reused until the file changes
+_BASELINES = {}
+
+
+def load_baseline(source):
+    """load_image() with a per-process cache for baseline files"""
+    if not isinstance(source, (str, os.PathLike)):
+        return load_image(source)
+    key = (os.fspath(source), os.path.getmtime(source))
+    if key not in _BASELINES:
+        if len(_BASELINES) >= 16:
+            _BASELINES.clear()
+        _BASELINES[key] = load_image(source)
+    return _BASELINES[key]
+
+
+class VisualDiff:
+    """Tolerance-aware pixel comparison.
+
+    channel_tolerance  max absolute difference per channel (int or (r, g, b))
+    antialiasing       ignore differing pixels that match a neighbour in the other image
+    ignore_regions     list of (x, y, width, height) boxes excluded from the comparison
+    max_diff_ratio     fraction of differing pixels still considered a pass
+    tile_rows          rows compared per tile; comparison stops once the budget is exceeded
+    """
+
+    def __init__(self, channel_tolerance=16, antialiasing=True, ignore_regions=(),
+                 max_diff_ratio=0.0, tile_rows=128, early_exit=True):
+        self.tolerance = np.broadcast_to(np.asarray(channel_tolerance, dtype=np.int16), (3,))
+        self.antialiasing = antialiasing
+        self.ignore_regions = list(ignore_regions)
+        self.max_diff_ratio = max_diff_ratio
+        self.tile_rows = tile_rows
+        self.early_exit = early_exit
+
+    def _mask(self, shape):
+        mask = np.ones(shape[:2], dtype=bool)
+        for x, y, w, h in self.ignore_regions:
+            mask[max(y, 0):y + h, max(x, 0):x + w] = False
+        return mask
+
+    def _differs(self, a, b):
+        """Boolean map of pixels where any channel exceeds its tolerance"""
+        if np.array_equal(a, b):
+            return np.zeros(a.shape[:2], dtype=bool)
+        # Only pay for the signed difference on pixels that changed at all
+        changed = (a != b).any(axis=2)
+        ys, xs = np.nonzero(changed)
+        delta = np.abs(a[ys, xs].astype(np.int16) - b[ys, xs].astype(np.int16))
+        changed[ys, xs] = (delta > self.tolerance).any(axis=1)
+        return changed
+
+    def _antialiased(self, a, b, candidates, row_offset):
+        """Candidates that match some neighbour of the other image (edge shifts of 1 px)"""
+        ys, xs = np.nonzero(candidates)
+        if ys.size == 0:
+            return candidates
+        ys_abs = ys + row_offset
+        h, w = a.shape[:2]
+        explained = np.zeros(ys.size, dtype=bool)
+        # An edge moved by d leaves a(p) in b at p + d and b(p) in a at p - d
+        for dy, dx in NEIGHBOURS:
+            ny, nx = np.clip(ys_abs + dy, 0, h - 1), np.clip(xs + dx, 0, w - 1)
+            py, px = np.clip(ys_abs - dy, 0, h - 1), np.clip(xs - dx, 0, w - 1)
+            close_ab = (np.abs(a[ys_abs, xs].astype(np.int16) - b[ny, nx].astype(np.int16)) <= self.tolerance).all(axis=1)
+            close_ba = (np.abs(b[ys_abs, xs].astype(np.int16) - a[py, px].astype(np.int16)) <= self.tolerance).all(axis=1)
+            explained |= close_ab & close_ba
+        remaining = candidates.copy()
+        remaining[ys[explained], xs[explained]] = False
+        return remaining
+
+    def compare(self, baseline, current, diff_path=None):
+        a, b = load_baseline(baseline), load_image(current)
+        if a.shape != b.shape:
+            return DiffResult(False, reason=f"size mismatch {a.shape[1]}x{a.shape[0]} vs {b.shape[1]}x{b.shape[0]}")
+
+        mask = self._mask(a.shape)
+        total = int(mask.sum())
+        if not self.ignore_regions and np.array_equal(a, b):
+            return DiffResult(True, 0, total)
+        budget = int(total * self.max_diff_ratio)
+        diff_map = np.zeros(a.shape[:2], dtype=bool)
+        diff_pixels = 0
+
+        for top in range(0, a.shape[0], self.tile_rows):
+            rows = slice(top, top + self.tile_rows)
+            tile = self._differs(a[rows], b[rows]) & mask[rows]
+            if self.antialiasing and tile.any():
+                tile = self._antialiased(a, b, tile, top)
+            diff_map[rows] = tile
+            diff_pixels += int(tile.sum())
+            if self.early_exit and diff_pixels > budget:
+                break
+
+        passed = diff_pixels <= budget
+        bbox = None
+        if diff_pixels:
+            ys, xs = np.nonzero(diff_map)
+            bbox = (int(xs.min()), int(ys.min()), int(xs.max()) + 1, int(ys.max()) + 1)
+        result = DiffResult(passed, diff_pixels, total, bbox)
+        if not passed and diff_path:
+            write_heatmap(a, b, diff_map, diff_path)
+            result.diff_path = diff_path
+        return result
+
+
+def write_heatmap(a, b, diff_map, path):
+    """Dimmed baseline with differing pixels coloured by magnitude (yellow -> red)"""
+    gray = a.mean(axis=2, keepdims=True).astype(np.uint8) // 3
+    out = np.repeat(gray, 3, axis=2)
+    magnitude = np.abs(a.astype(np.int16) - b.astype(np.int16)).max(axis=2)
+    ys, xs = np.nonzero(diff_map)
+    out[ys, xs, 0] = 255
+    out[ys, xs, 1] = 255 - np.clip(magnitude[ys, xs], 0, 255).astype(np.uint8)
+    out[ys, xs, 2] = 0
+    Image.fromarray(out).save(path, compress_level=1)
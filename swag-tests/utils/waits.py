@@ -0,0 +1,176 @@
+# utils/waits.py
+import time
+from selenium.common.exceptions import JavascriptException, StaleElementReferenceException, TimeoutException
+
+# Budgets in seconds. Positive waits get the default, "is it there?" checks the short one.
+DEFAULT_TIMEOUT = 10
+SHORT_TIMEOUT = 1.0
+
+# Pause before re-arming an observed wait whose document or element went away
+MIN_POLL = 0.05
+
+# Longest a single observed wait may block inside execute_async_script; make_driver sets the driver's script timeout to this
+SCRIPT_TIMEOUT = 120
+
+# How chromedriver reports an async script whose document went away (a full page load)
+NAVIGATION_ERRORS = (
+    "document unloaded",
+    "execution context was destroyed",
+    "cannot find context with specified id",
+    "inspected target navigated or closed",
+)
+
+# Blocks in the page until a condition on a locator holds, re-checking on every DOM mutation.
+# The 100 ms interval catches changes that fire no mutation (CSS transitions, layout).
+# Arguments: kind, by, value, timeout_ms, callback. Resolves with the element, true, or null on timeout.
+OBSERVE_JS = """
+const [kind, by, value, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+function findAll() {
+    switch (by) {
+        case 'id': return Array.from(document.querySelectorAll('[id="' + CSS.escape(value) + '"]'));
+        case 'css selector': return Array.from(document.querySelectorAll(value));
+        case 'class name': return Array.from(document.getElementsByClassName(value));
+        case 'name': return Array.from(document.getElementsByName(value));
+        case 'tag name': return Array.from(document.getElementsByTagName(value));
+        case 'xpath': {
+            const snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            return Array.from({length: snapshot.snapshotLength}, (_, i) => snapshot.snapshotItem(i));
+        }
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+function visible(el) {
+    const style = getComputedStyle(el);
+    return el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.opacity !== '0';
+}
+function check() {
+    const els = findAll();
+    switch (kind) {
+        case 'present': return els[0] || null;
+        case 'visible': return els.find(visible) || null;
+        case 'clickable': return els.find(el => visible(el) && !el.disabled) || null;
+        case 'absent': return els.every(el => !visible(el)) || null;
+    }
+    throw new Error('Unknown condition: ' + kind);
+}
+const first = check();
+if (first) return done(first);
+let observer, timer, deadline;
+function finish(result) {
+    observer.disconnect();
+    clearInterval(timer);
+    clearTimeout(deadline);
+    done(result);
+}
+const recheck = () => { const result = check(); if (result) finish(result); };
+observer = new MutationObserver(recheck);
+observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+timer = setInterval(recheck, 100);
+deadline = setTimeout(() => finish(null), timeoutMs);
+"""
+
+
+class WaitStats:
+    """Accumulates time spent waiting during the current test"""
+
+    def __init__(self):
+        # Called as listener(description, elapsed, timed_out) for every wait
+        self.listeners = []
+        self.reset()
+
+    def reset(self):
+        self.total = 0.0
+        self.count = 0
+        self.timeouts = 0
+        self.slowest = None
+
+    def record(self, description, elapsed, timed_out):
+        self.total += elapsed
+        self.count += 1
+        self.timeouts += int(timed_out)
+        if self.slowest is None or elapsed > self.slowest[1]:
+            self.slowest = (description, elapsed)
+        for listener in self.listeners:
+            listener(description, elapsed, timed_out)
+
+
+# One test runs at a time per worker process, so a module-level recorder is enough
+WAIT_STATS = WaitStats()
+
+
+class Waiter:
+    """Explicit wait primitives for page objects. Expects the driver's implicit wait to be 0."""
+
+    def __init__(self, driver, stats=WAIT_STATS):
+        self.driver = driver
+        self.stats = stats
+
+    def _require(self, result, timeout, description):
+        if not result:
+            raise TimeoutException(f"Timed out after {timeout}s waiting for {description}")
+        return result
+
+    def observe(self, kind, locator, timeout=DEFAULT_TIMEOUT, description=None):
+        """Block in one execute_async_script call until `kind` holds for `locator`.
+
+        kind is one of present, visible, clickable or absent. Returns the
+        element for element conditions, True for absent, or None on timeout.
+        """
+        description = description or f"{kind} {locator}"
+        # Drivers sharing a WebDriver session with others (browser contexts) must not hold it for long
+        max_block = getattr(self.driver, "max_block_s", None)
+        start = time.monotonic()
+        while True:
+            remaining = max(timeout - (time.monotonic() - start), 0)
+            block = min(remaining, max_block) if max_block else remaining
+            try:
+                result = self.driver.execute_async_script(OBSERVE_JS, kind, *locator, int(block * 1000))
+            except JavascriptException as e:
+                # Only a document replaced mid-wait is retried (on the new one); script
+                # errors such as an invalid selector are real failures
+                if not any(text in (e.msg or "").lower() for text in NAVIGATION_ERRORS):
+                    raise
+                result = None
+                time.sleep(MIN_POLL)
+            except StaleElementReferenceException:
+                result = None
+                time.sleep(MIN_POLL)
+            elapsed = time.monotonic() - start
+            if result or elapsed >= timeout:
+                self.stats.record(description, elapsed, not result)
+                return result
+
+    # --- Conditions ---
+    def _first(self, locator, displayed=False, enabled=False):
+        for el in self.driver.find_elements(*locator):
+            if displayed and not el.is_displayed():
+                continue
+            if enabled and not el.is_enabled():
+                continue
+            return el
+        return None
+
+    # --- Positive waits: raise TimeoutException like WebDriverWait ---
+    def present(self, locator, timeout=DEFAULT_TIMEOUT):
+        result = self.observe("present", locator, timeout, description=f"presence of {locator}")
+        return self._require(result, timeout, f"presence of {locator}")
+
+    def visible(self, locator, timeout=DEFAULT_TIMEOUT):
+        result = self.observe("visible", locator, timeout, description=f"visibility of {locator}")
+        return self._require(result, timeout, f"visibility of {locator}")
+
+    def clickable(self, locator, timeout=DEFAULT_TIMEOUT):
+        result = self.observe("clickable", locator, timeout, description=f"clickable {locator}")
+        return self._require(result, timeout, f"clickable {locator}")
+
+    # --- Boolean checks: short budgets, never raise ---
+    def is_visible(self, locator, timeout=SHORT_TIMEOUT):
+        return self.observe("visible", locator, timeout, description=f"is_visible {locator}") is not None
+
+    def is_absent(self, locator, timeout=SHORT_TIMEOUT):
+        return bool(self.observe("absent", locator, timeout, description=f"is_absent {locator}"))
+
+    def find_now(self, locator):
+        """Single probe with no waiting; None if the element is not there"""
+        return self._first(locator)